@@ -134,18 +134,18 @@ async def get_analysis_status(domain: str):
     """
     try:
         db = get_database()
-        report = await db.get_report(domain)
+        report = await db.get_report_status(domain)
         
         if not report:
             raise HTTPException(status_code=404, detail="Analysis not found")
         
-        if report.status == AnalysisStatus.FAILED:
+        if report['status'] == AnalysisStatus.FAILED:
             return AnalysisResponse(
                 success=False,
-                message=f"Analysis failed: {report.error_message}",
+                message=f"Analysis failed: {report['error_message']}",
                 report_id=domain
             )
-        elif report.status == AnalysisStatus.COMPLETED:
+        elif report['status'] == AnalysisStatus.COMPLETED:
             return AnalysisResponse(
                 success=True,
                 message="Analysis completed successfully",
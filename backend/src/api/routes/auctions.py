@@ -26,6 +26,9 @@ from utils.date_utils import parse_iso_datetime
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Expiration used for NameSilo listings that arrive without one
+_FAR_FUTURE = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
 
 async def _clear_staging_chunked(db, auction_site: str, job_id: str):
     """
@@ -254,16 +257,14 @@ async def process_csv_upload_async(
 
             # Insert into staging
             # Prepare staging records (remove 'ranking', 'score' if None, etc.)
-            staging_batch = []
-            for record in batch:
-                # Create a clean dict for staging
-                staging_record = {k: v for k, v in record.items() if k not in ['ranking']}
+            # Records are built fresh for this batch, so clean them in place rather than copying
+            staging_batch = batch
+            for staging_record in staging_batch:
+                staging_record.pop('ranking', None)
                 
                 # Cleanup specific fields
                 if 'offer_type' in staging_record and not staging_record['offer_type']:
                      del staging_record['offer_type']
-                     
-                staging_batch.append(staging_record)
             
             # Retry logic for insert
             max_retries = 2
@@ -315,7 +316,7 @@ async def process_csv_upload_async(
                 
                 # NameSilo fallback
                 if not expiration_date and auction_site.lower() == 'namesilo':
-                     expiration_date = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+                     expiration_date = _FAR_FUTURE
                 
                 expiration_date_iso = expiration_date.isoformat() if expiration_date else None
 
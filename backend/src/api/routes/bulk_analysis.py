@@ -5,6 +5,7 @@ Bulk Domain Analysis API routes
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Body
 from typing import Optional, List, Dict, Any
 import structlog
+import re
 import uuid
 from datetime import datetime, timedelta
 
@@ -32,6 +33,10 @@ _csv_cache: Dict[str, Dict[str, Any]] = {}
 # In-memory storage for scored domains (keyed by file_id)
 _csv_scored_cache: Dict[str, Dict[str, Any]] = {}
 
+# Per-row CSV filter patterns: anything but alphanumerics, dots and hyphens; any digit
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9.\-]')
+_DIGIT_RE = re.compile(r'\d')
+
 
 @router.get("/domains")
 async def get_bulk_domains(
@@ -462,13 +467,13 @@ async def get_csv_domains(
                    filter_status=filter_status)
         
         # Apply filters
+        extension_list = [ext.strip() for ext in extensions.split(',') if ext.strip()] if extensions else []
         filtered_domains = []
         for domain in domains_to_filter:
             domain_name = domain.name
             
             # Extension filter
             if extensions:
-                extension_list = [ext.strip() for ext in extensions.split(',') if ext.strip()]
                 if '.' in domain_name:
                     domain_ext = '.' + domain_name.split('.')[-1]
                     if domain_ext not in extension_list:
@@ -478,14 +483,12 @@ async def get_csv_domains(
             
             # No special chars filter
             if no_special_chars:
-                import re
-                if re.search(r'[^a-zA-Z0-9.\-]', domain_name):
+                if _SPECIAL_CHARS_RE.search(domain_name):
                     continue
             
             # No numbers filter
             if no_numbers:
-                import re
-                if re.search(r'\d', domain_name):
+                if _DIGIT_RE.search(domain_name):
                     continue
             
             # Search filter
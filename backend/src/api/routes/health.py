@@ -58,14 +58,9 @@ async def health_check():
             try:
                 db = await init_database()
             except Exception as init_error:
-                # If init fails, try to get existing instance or create a new one
-                logger.debug("init_database failed, trying to get existing instance", error=str(init_error))
-                from services.database import get_database, DatabaseService
-                try:
-                    db = get_database()
-                except RuntimeError:
-                    # No existing instance, create a new one (client should still be initialized)
-                    db = DatabaseService()
+                # If init fails, fall back to the shared instance (client should still be initialized)
+                logger.debug("init_database failed, using existing instance", error=str(init_error))
+                db = get_database()
             
             if db.client is None:
                 services_status['database'] = 'unhealthy'
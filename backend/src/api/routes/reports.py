@@ -255,7 +255,7 @@ async def get_domain_keywords(
     """
     try:
         db = get_database()
-        report = await db.get_report(domain)
+        report = await db.get_report_status(domain)
         
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -335,7 +335,7 @@ async def export_domain_keywords(domain: str):
     """
     try:
         db = get_database()
-        report = await db.get_report(domain)
+        report = await db.get_report_status(domain)
         
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -374,7 +374,7 @@ async def get_domain_backlinks(
     """
     try:
         db = get_database()
-        report = await db.get_report(domain)
+        report = await db.get_report_status(domain)
         
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -428,7 +428,7 @@ async def export_domain_backlinks(domain: str):
     """
     try:
         db = get_database()
-        report = await db.get_report(domain)
+        report = await db.get_report_status(domain)
         
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
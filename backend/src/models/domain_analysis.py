@@ -51,6 +51,7 @@ class DataSource(str, Enum):
     DATAFORSEO = "dataforseo"
     WAYBACK_MACHINE = "wayback_machine"
     GEMINI = "gemini"
+    LLM = "llm"  # Generated analyses, keyed by prompt hash
 
 
 class DomainAnalysisRequest(BaseModel):
@@ -46,12 +46,7 @@ class AnalysisService:
     @property
     def db(self):
         if self._db is None:
-            try:
-                self._db = get_database()
-            except RuntimeError:
-                # Database not initialized, create a new instance
-                from services.database import DatabaseService
-                self._db = DatabaseService()
+            self._db = get_database()
         return self._db
     
     async def analyze_domain(self, domain: str, report_id: str = None, mode: str = "dual", user_id: Optional[UUID] = None) -> DomainAnalysisReport:
@@ -56,9 +56,9 @@ class AuctionsService:
             if auction_site_lower == 'godaddy':
                 if is_file:
                     with open(file_content, 'r', encoding='utf-8', errors='replace') as f:
-                        auctions = self.csv_parser.parse_godaddy_json(f, is_handle=True)
+                        auctions = list(self.csv_parser.parse_godaddy_json(f, is_handle=True))
                 else:
-                    auctions = self.csv_parser.parse_godaddy_json(file_content)
+                    auctions = list(self.csv_parser.parse_godaddy_json(file_content))
             else:
                 raise ValueError(f"JSON parsing not supported for auction site: {auction_site}")
             
@@ -19,6 +19,9 @@ logger = structlog.get_logger()
 class BulkAnalysisService:
     """Service for bulk domain analysis operations"""
     
+    # Domains requested per page; PostgREST's max-rows (1000 by default) may return fewer
+    _MISSING_SUMMARY_PAGE_SIZE = 1000
+    
     def __init__(self):
         self.db = get_database()
         self.n8n_service = N8NService()
@@ -59,7 +62,7 @@ class BulkAnalysisService:
         try:
             # Get domains missing summary if not provided
             if domains is None:
-                domains = await self.db.get_bulk_domains_missing_summary()
+                domains = await self._get_all_domains_missing_summary()
             
             if not domains:
                 logger.info("No domains need bulk data collection")
@@ -95,6 +98,19 @@ class BulkAnalysisService:
             logger.error("Failed to trigger bulk data collection", error=str(e))
             raise
     
+    async def _get_all_domains_missing_summary(self) -> List[str]:
+        """Page through every domain missing summary data, past PostgREST's max-rows cap"""
+        domains: List[str] = []
+        while True:
+            page = await self.db.get_bulk_domains_missing_summary(
+                limit=self._MISSING_SUMMARY_PAGE_SIZE,
+                after=domains[-1] if domains else None
+            )
+            # A short page is not proof of the end: max-rows may be set below the page size
+            if not page:
+                return domains
+            domains.extend(page)
+    
     async def analyze_selected_domains(self, domain_names: List[str]) -> NamecheapAnalysisResponse:
         """
         Analyze selected domains by checking for existing DataForSeo data or triggering collection
@@ -2,28 +2,444 @@
 CSV Parser Service for multiple auction site formats
 """
 
+import codecs
 import csv
+import functools
 import io
+import itertools
 import json
-from typing import List, Dict, Any, Optional, Iterator
-from datetime import datetime
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Callable
+from datetime import datetime, timezone
+import pandas as pd
 import structlog
 
+try:
+    from ciso8601 import parse_datetime as ciso8601_parse_datetime
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from models.auctions import AuctionInput
 from utils.date_utils import parse_iso_datetime
 
 logger = structlog.get_logger()
 
+# Expiration used for listings without an end date (Buy Now, offers)
+_FAR_FUTURE = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+# Rows per DataFrame chunk; keeps memory flat on multi-hundred-MB exports
+_DATAFRAME_CHUNK_ROWS = 10000
+
+# Per-row warnings logged per parse before falling back to summary counts
+_MAX_ROW_LOGS = 10
+
+# Files at least this large go through pyarrow's multithreaded CSV reader when installed
+_PYARROW_MIN_BYTES = 1024 * 1024
+_PYARROW_BLOCK_BYTES = 8 << 20
+_HEADER_READ_BYTES = 64 << 10
+
+# Default parse options make pyarrow raise on rows with the wrong field count;
+# those files are re-read with pandas, which pads short rows
+_ARROW_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True) if PYARROW_AVAILABLE else None
+
+# Shapes of date strings found in auction exports, used to pick a parser up front
+_DATE_CLASSIFIER = re.compile(r'^(?:(?P<iso>\d{4}-\d{2}-\d{2})|(?P<slash>\d{1,2}/\d{1,2}/\d{4})$)')
+
+# Last-resort formats for strings dateutil could not handle, keyed by the string
+# shape they accept so only the matching format(s) are tried
+_DATE_FORMATS_BY_SHAPE = tuple((re.compile(shape), formats) for shape, formats in (
+    (r'\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}', ('%Y-%m-%d %H:%M:%S',)),
+    (r'\d{4}-\d{1,2}-\d{1,2}', ('%Y-%m-%d',)),
+    (r'\d{1,2}/\d{1,2}/\d{4}', ('%m/%d/%Y', '%d/%m/%Y')),
+    (r'\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}', ('%Y-%m-%dT%H:%M:%S',)),
+    (r'\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}\.\d{1,6}', ('%Y-%m-%dT%H:%M:%S.%f',)),
+))
+
+# Price cleanup: characters stripped on the fast path, and the full regex fallback
+_PRICE_STRIP = str.maketrans('', '', '$€£¥, \t')
+_PRICE_RE = re.compile(r'[^\d.-]')
+_PRICE_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_price_cached(price_str: str) -> Optional[float]:
+    """
+    Parse a price string. Memoized because auction exports repeat the same
+    handful of prices ("$10", "$25.00", ...) across thousands of rows.
+    """
+    stripped = price_str.strip()
+    if not stripped:
+        return None
+
+    # Fast path: str.translate drops currency symbols, separators and spaces in C.
+    # Only take it when just digits, one dot and a leading minus remain, so float()
+    # never sees "nan", "inf" or "1e3" and results match the regex path.
+    cleaned = stripped.translate(_PRICE_STRIP)
+    digits = cleaned[1:] if cleaned.startswith('-') else cleaned
+    if digits.replace('.', '', 1).isdecimal():
+        return float(cleaned)
+
+    # Remove everything except digits, dots, and minus signs
+    cleaned = _PRICE_RE.sub('', stripped)
+    if not cleaned or cleaned == '-' or cleaned == '.':
+        return None
+    # Check the shape float() accepts instead of catching its ValueError
+    if not _PRICE_NUMBER.fullmatch(cleaned):
+        logger.warning("Could not parse price", price_str=price_str, cleaned=cleaned)
+        return None
+    return float(cleaned)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    Parse a non-empty date string. Memoized because auctions in one export
+    tend to close on the same handful of timestamps.
+    """
+    try:
+        # Classify the string once and go straight to the matching parser
+        shape = _DATE_CLASSIFIER.match(date_str)
+        if shape and shape.group('iso'):
+            try:
+                if CISO8601_AVAILABLE:
+                    # ~10x faster than fromisoformat and handles 'Z' itself
+                    return ciso8601_parse_datetime(date_str)
+                # datetime.fromisoformat is C-implemented but (on 3.10) has no 'Z' support
+                iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
+                return datetime.fromisoformat(iso_str)
+            except ValueError:
+                pass  # e.g. 1-2 digit fractions; fall through to dateutil
+        elif shape:
+            # Month-first unless the first part cannot be a month (same as dateutil)
+            first = int(shape.group('slash').split('/', 1)[0])
+            return datetime.strptime(date_str, '%m/%d/%Y' if first <= 12 else '%d/%m/%Y')
+        
+        # Try ISO format first
+        parsed = parse_iso_datetime(date_str)
+        if parsed:
+            return parsed
+        
+        # Try common date formats
+        stripped = date_str.strip()
+        for shape, formats in _DATE_FORMATS_BY_SHAPE:
+            if shape.fullmatch(stripped):
+                for fmt in formats:
+                    try:
+                        return datetime.strptime(stripped, fmt)
+                    except ValueError:
+                        continue
+                break
+        
+        logger.warning("Could not parse date", date_str=date_str)
+        return None
+        
+    except Exception as e:
+        logger.warning("Date parsing error", date_str=date_str, error=str(e))
+        return None
+
+
+def _read_csv_chunks(csv_file: Any) -> Optional[Iterator[pd.DataFrame]]:
+    """
+    Read a CSV file as string-typed DataFrame chunks
+    
+    Every cell stays a string ('' for blanks) so the per-site parsers keep
+    control over date/price interpretation. Returns None for empty input.
+    """
+    arrow_input = _arrow_input(csv_file) if PYARROW_AVAILABLE else None
+    if arrow_input is not None:
+        start = csv_file.tell()
+        chunks = _read_arrow_chunks(arrow_input, csv_file, start)
+        if chunks is not None:
+            return _prefetch_chunks(chunks)
+        csv_file.seek(start)
+    
+    reader = _read_pandas_chunks(csv_file)
+    return _prefetch_chunks(reader) if reader is not None else None
+
+
+def _read_pandas_chunks(csv_file: Any) -> Optional[Iterator[pd.DataFrame]]:
+    """Read string-typed chunks with pandas' C reader; None for empty input"""
+    try:
+        return pd.read_csv(
+            csv_file,
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+            index_col=False,
+            chunksize=_DATAFRAME_CHUNK_ROWS
+        )
+    except pd.errors.EmptyDataError:
+        return None
+
+
+def _file_size(csv_file: Any) -> int:
+    """Size in bytes of a file-backed handle, 0 for in-memory buffers"""
+    try:
+        return os.fstat(csv_file.fileno()).st_size
+    except (AttributeError, OSError):
+        return 0
+
+
+def _arrow_input(csv_file: Any) -> Optional[Callable[[], Any]]:
+    """
+    Return a factory for fresh pyarrow inputs over the raw bytes behind
+    ``csv_file``, or None if the input is small or has no byte source
+    
+    Covers files on disk (memory-mapped, so pages are read on demand instead of
+    copied through Python file objects) and bytes uploads wrapped in
+    TextIOWrapper(BytesIO), which pyarrow can read without decoding in Python.
+    """
+    if _file_size(csv_file) >= _PYARROW_MIN_BYTES:
+        return lambda: pa.memory_map(csv_file.name)
+    
+    buffer = getattr(csv_file, 'buffer', None)
+    if isinstance(buffer, io.BytesIO) and buffer.getbuffer().nbytes >= _PYARROW_MIN_BYTES:
+        def rewind():
+            buffer.seek(0)
+            return buffer
+        return rewind
+    
+    return None
+
+
+def _read_arrow_chunks(arrow_input: Callable[[], Any], csv_file: Any, start: int) -> Optional[Iterator[pd.DataFrame]]:
+    """
+    Stream a CSV file through pyarrow's SIMD-accelerated reader
+    
+    Produces the same string-typed chunks as the pandas path. Returns None if
+    pyarrow cannot open the file (e.g. invalid UTF-8), so the caller can fall
+    back to pandas. Rows with the wrong field count are left to pandas too, so
+    ragged files are handled identically whichever reader starts on them.
+    """
+    source = arrow_input()
+    try:
+        columns = _read_arrow_header(source)
+        if columns is None:
+            _close_arrow_source(source)
+            return None
+        # Column names come from the header already consumed, so every column can
+        # be read as a plain string without a type-inference pass
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=_PYARROW_BLOCK_BYTES, column_names=columns),
+            parse_options=_ARROW_PARSE_OPTIONS,
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in columns},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False
+            )
+        )
+    except (pa.ArrowInvalid, OSError, UnicodeDecodeError) as e:
+        _close_arrow_source(source)
+        logger.warning("pyarrow could not read CSV, falling back to pandas", error=str(e))
+        return None
+    return _arrow_batches_to_frames(reader, source, columns, csv_file, start)
+
+
+def _read_arrow_header(source: Any) -> Optional[List[str]]:
+    """
+    Read the header record from a pyarrow source, leaving it positioned at the
+    first data row
+    
+    Leading blank lines are skipped, as pandas does. Returns None if the input
+    has no header.
+    """
+    data = source.read(_HEADER_READ_BYTES)
+    record_start = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+    search_from = record_start
+    while True:
+        newline = data.find(b'\n', search_from)
+        if newline == -1:
+            chunk = source.read(_HEADER_READ_BYTES)
+            if chunk:
+                data += chunk
+                continue
+            record_end = len(data)
+        elif data.count(b'"', record_start, newline) % 2:
+            # Newline inside a quoted column name
+            search_from = newline + 1
+            continue
+        else:
+            record_end = newline + 1
+        
+        record = data[record_start:record_end]
+        if record.strip() or record_end == len(data):
+            break
+        record_start = search_from = record_end
+    
+    columns = next(csv.reader(io.StringIO(record.decode('utf-8'), newline='')), None)
+    if not columns:
+        return None
+    source.seek(record_end)
+    return columns
+
+
+def _close_arrow_source(source: Any):
+    """Close pyarrow-owned inputs (memory maps); upload buffers belong to the caller"""
+    if isinstance(source, pa.NativeFile):
+        source.close()
+
+
+def _arrow_batches_to_frames(reader: Any, source: Any, columns: List[str], csv_file: Any, start: int) -> Iterator[pd.DataFrame]:
+    """
+    Convert pyarrow record batches to DataFrames with a file-wide row index
+    
+    If a later block fails to parse (a ragged row, invalid UTF-8), the rest of
+    the file is read with pandas from ``start``, skipping the rows already
+    yielded, so the output matches a pandas-only read.
+    """
+    offset = 0
+    try:
+        for batch in reader:
+            df = batch.to_pandas()
+            df.index = pd.RangeIndex(offset, offset + len(df))
+            offset += len(df)
+            yield df
+    except (pa.ArrowInvalid, OSError) as e:
+        logger.warning("pyarrow failed mid-file, resuming with pandas", row=offset, error=str(e))
+    else:
+        if offset == 0:
+            # Header-only file: still hand the parsers the column names
+            yield pd.DataFrame(columns=columns, dtype=object)
+        return
+    finally:
+        reader.close()
+        _close_arrow_source(source)
+    
+    csv_file.seek(start)
+    yield from _drop_leading_rows(_read_pandas_chunks(csv_file) or iter(()), offset)
+
+
+def _drop_leading_rows(chunks: Iterator[pd.DataFrame], count: int) -> Iterator[pd.DataFrame]:
+    """Skip the first ``count`` rows of a chunk stream, keeping the row index"""
+    for df in chunks:
+        if count >= len(df):
+            count -= len(df)
+            continue
+        yield df.iloc[count:] if count else df
+        count = 0
+
+
+def _prefetch_chunks(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Read the next chunk in a worker thread while the caller converts the current one
+    
+    pandas' C tokenizer releases the GIL, so file I/O and tokenizing of chunk
+    N+1 overlap with the Python-level row building for chunk N.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(next, chunks, None)
+        while True:
+            chunk = pending.result()
+            if chunk is None:
+                return
+            pending = executor.submit(next, chunks, None)
+            yield chunk
+
+
+def _coalesce_columns(df: pd.DataFrame, columns: List[str], strip: bool = False) -> pd.Series:
+    """Return the first non-empty value per row across candidate columns"""
+    result = pd.Series('', index=df.index, dtype=object)
+    for col in columns:
+        if col not in df.columns:
+            continue
+        values = df[col].str.strip() if strip else df[col]
+        result = result.where(result != '', values)
+    return result
+
+
+def _resolve(fieldnames: Iterable[str], *candidates: str) -> Optional[str]:
+    """Return the first candidate column name present in ``fieldnames``"""
+    return next((name for name in candidates if name in fieldnames), None)
+
+
+def _pick(fieldnames: Iterable[str], candidates: Iterable[str]) -> List[str]:
+    """Return every candidate column name present in ``fieldnames``, in candidate order"""
+    return [name for name in candidates if name in fieldnames]
+
+
+def _row_to_dict(header: List[str], row: List[Optional[str]]) -> Dict[Any, Any]:
+    """Build the dict csv.DictReader would yield for ``row`` (extra fields under None)"""
+    source_data = dict(zip(header, row))
+    if len(row) > len(header):
+        source_data[None] = row[len(header):]
+    return source_data
+
+
+def _log_skipped_rows(message: str, row_numbers: List[int], **fields: Any) -> None:
+    """Log one warning for a batch of skipped rows instead of one per row"""
+    if row_numbers:
+        logger.warning(message, count=len(row_numbers), rows=row_numbers[:_MAX_ROW_LOGS], **fields)
+
+
+def _map_unique(values: pd.Series, parse: Callable[[str], Any]) -> List[Any]:
+    """Apply ``parse`` once per distinct value and broadcast the results back"""
+    values = values.tolist()
+    parsed = {value: parse(value) for value in set(values)}
+    return [parsed[value] for value in values]
+
+
+def _parse_namesilo_buy_now(value: str) -> float:
+    """Parse a NameSilo Buy_Now price, ignoring suffixes like " (hidden)" """
+    try:
+        buy_now_clean = ''.join(c for c in value.strip() if c.isdigit() or c == '.')
+        return float(buy_now_clean) if buy_now_clean else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _parse_namesilo_bid(value: str) -> float:
+    """Parse a NameSilo Current Bid, defaulting to 0.0"""
+    try:
+        current_bid_str = value.strip()
+        return float(current_bid_str) if current_bid_str else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
 
 class CSVParserService:
     """Service for parsing CSV files from different auction sites"""
     
+    # Candidate column names per field, in priority order
+    _NAMECHEAP_START_KEYS = ('startDate', 'StartDate', 'start_date', 'Start Date')
+    _NAMECHEAP_END_KEYS = ('endDate', 'EndDate', 'end_date', 'End Date', 'Auction End')
+    _NAMECHEAP_PRICE_KEYS = ('price', 'Price', 'currentBid', 'current_bid', 'Current Bid')
+    _NAMECHEAP_URL_KEYS = ('url', 'Url', 'URL', 'link', 'Link')
+    
+    _GODADDY_DOMAIN_KEYS = ('Domain', 'domain')
+    _GODADDY_START_KEYS = ('Start Date', 'startDate', 'start_date')
+    _GODADDY_END_KEYS = ('End Date', 'endDate', 'end_date', 'Expiration Date', 'expirationDate', 'expiration_date')
+    _GODADDY_PRICE_KEYS = ('Price', 'price', 'Current Bid', 'currentBid', 'current_bid')
+    
+    _GENERIC_DOMAIN_KEYS = ('domain', 'name', 'Domain', 'Name', 'domain_name')
+    _GENERIC_END_KEYS = ('expiration_date', 'end_date', 'expirationDate', 'endDate',
+                         'Expiration Date', 'End Date', 'expiration', 'expires')
+    _GENERIC_START_KEYS = ('start_date', 'startDate', 'Start Date', 'start')
+    _GENERIC_PRICE_KEYS = ('price', 'Price', 'currentBid', 'current_bid', 'Current Bid', 'bid', 'Bid')
+    
     def parse_csv(self, source: Any, auction_site: str, filename: str = '', is_file: bool = False) -> Iterator[AuctionInput]:
         """
         Parse CSV content based on auction site format
         
         Args:
-            source: Raw CSV content as string OR file path if is_file=True
+            source: Raw CSV content as string or bytes OR file path if is_file=True
             auction_site: Source auction site ('namecheap', 'godaddy', 'namesilo', etc.)
             filename: Original filename (used for format detection)
             is_file: Whether source is a file path
@@ -31,17 +447,52 @@ class CSVParserService:
         Returns:
             Iterator of AuctionInput objects
         """
+        # Only sources no bigger than a UTF-8 BOM can decode to nothing, so the
+        # read/seek emptiness probe is skipped for everything else
         if is_file:
+            may_be_empty = os.path.getsize(source) <= len(codecs.BOM_UTF8)
             # Use utf-8-sig to handle BOM automatically
             with open(source, 'r', encoding='utf-8-sig', errors='replace') as f:
-                yield from self._parse_csv_internal(f, auction_site, filename)
+                yield from self._parse_csv_internal(f, auction_site, filename, may_be_empty)
+        elif isinstance(source, (bytes, bytearray)):
+            may_be_empty = len(source) <= len(codecs.BOM_UTF8)
+            # Decode lazily instead of materializing a second, decoded copy of the upload
+            with io.TextIOWrapper(io.BytesIO(source), encoding='utf-8-sig', errors='replace', newline='') as csv_file:
+                yield from self._parse_csv_internal(csv_file, auction_site, filename, may_be_empty)
         else:
             csv_file = io.StringIO(source)
-            yield from self._parse_csv_internal(csv_file, auction_site, filename)
+            yield from self._parse_csv_internal(csv_file, auction_site, filename, not source)
 
-    def _parse_csv_internal(self, csv_file: Any, auction_site: str, filename: str = '') -> Iterator[AuctionInput]:
+    def parse_csv_iter(
+        self,
+        source: Any,
+        auction_site: str,
+        filename: str = '',
+        is_file: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[List[AuctionInput]]:
+        """
+        Parse CSV content in batches of at most ``batch_size`` AuctionInputs
+
+        Only one batch is held in memory at a time, so callers can insert each
+        batch into the database while the rest of the file is still unread.
+        """
+        auctions = self.parse_csv(source, auction_site, filename, is_file=is_file)
+        while True:
+            batch = list(itertools.islice(auctions, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _parse_csv_internal(
+        self,
+        csv_file: Any,
+        auction_site: str,
+        filename: str = '',
+        may_be_empty: bool = True
+    ) -> Iterator[AuctionInput]:
         # Check for empty file
-        if hasattr(csv_file, 'seek') and hasattr(csv_file, 'read'):
+        if may_be_empty and hasattr(csv_file, 'seek') and hasattr(csv_file, 'read'):
             pos = csv_file.tell()
             content = csv_file.read(1)
             csv_file.seek(pos)
@@ -71,53 +522,69 @@ class CSVParserService:
         2. Namecheap_Market_Sales_Buy_Now: permalink, domain, price, extensions_taken (buy now format)
         """
         try:
-            # Load content into string if bytes or file handle
+            # Read only the head of the file for the preview and the Sniffer;
+            # the reader then streams from the handle instead of a full copy
             if hasattr(content, 'read'):
-                content_str = content.read()
+                csv_file = content
+                start = csv_file.tell()
+                content_head = csv_file.read(4096)
+                csv_file.seek(start)
             else:
-                content_str = content
+                csv_file = io.StringIO(content)
+                start = 0
+                content_head = content[:4096]
 
             # Log raw start of file to debug structure/BOM/delimiters
-            logger.info("Raw CSV Content Start", 
+            logger.debug("Raw CSV Content Start", 
                        filename=filename, 
-                       preview=content_str[:500] if len(content_str) > 0 else "EMPTY",
-                       length=len(content_str))
+                       preview=content_head[:500] if len(content_head) > 0 else "EMPTY")
 
-            if not content_str:
+            if not content_head:
                 logger.warning("CSV content is empty", filename=filename)
                 return
-
-            csv_file = io.StringIO(content_str)
             
-            # Use Sniffer to detect delimiter
-            try:
-                dialect = csv.Sniffer().sniff(content_str[:4096], delimiters=',;\t')
-                logger.info("Detected CSV dialect", delimiter=dialect.delimiter, quotechar=dialect.quotechar)
-                reader = csv.DictReader(csv_file, dialect=dialect)
-            except Exception as e:
-                logger.warning("CSV Sniffer failed, falling back to default", error=str(e))
-                csv_file.seek(0)
-                reader = csv.DictReader(csv_file)
+            # Namecheap exports are plain comma-separated, so only run the Sniffer
+            # (several passes over the head) when the header line says otherwise
+            header_line = content_head.split('\n', 1)[0]
+            if ',' in header_line and not any(sep in header_line for sep in (';', '\t', ', ')):
+                reader = csv.reader(csv_file)
+            else:
+                try:
+                    dialect = csv.Sniffer().sniff(content_head, delimiters=',;\t')
+                    logger.info("Detected CSV dialect", delimiter=dialect.delimiter, quotechar=dialect.quotechar)
+                    reader = csv.reader(csv_file, dialect=dialect)
+                except Exception as e:
+                    logger.warning("CSV Sniffer failed, falling back to default", error=str(e))
+                    csv_file.seek(start)
+                    reader = csv.reader(csv_file)
             
             # Check if headers exist
-            if not reader.fieldnames:
+            header = next(reader, None)
+            if not header:
                 logger.warning("CSV file has no headers or is empty", filename=filename)
                 return
             
             # Clean headers (strip whitespace)
-            reader.fieldnames = [str(h).strip() for h in reader.fieldnames] if reader.fieldnames else []
+            header = [h.strip() for h in header]
+            width = len(header)
             
-            logger.info("Final Cleaned Headers", headers=reader.fieldnames)
+            logger.info("Final Cleaned Headers", headers=header)
+
+            # Rows are plain lists; columns are looked up by index and the
+            # source_data dict is only built for rows that become auctions.
+            # Like DictReader, the last of any duplicate header names wins.
+            column_index = {name: i for i, name in enumerate(header)}
+            # DictReader skips blank lines, so row numbers only count non-blank rows
+            rows = enumerate((row for row in reader if row), start=2)
 
             # Helper to find column case-insensitively
+            lower_map = {f.lower(): f for f in header}
+
             def find_col(possible_names):
-                if not reader.fieldnames:
-                    return None
-                for name in possible_names:
-                    if name in reader.fieldnames:
-                        return name
+                found = _resolve(column_index, *possible_names)
+                if found:
+                    return found
                 # Fallback: check case-insensitive match
-                lower_map = {str(f).lower(): f for f in reader.fieldnames}
                 for name in possible_names:
                     if name.lower() in lower_map:
                         return lower_map[name.lower()]
@@ -125,7 +592,7 @@ class CSVParserService:
 
             # Check if this is the Buy Now format (has 'domain' and 'permalink' columns, no 'name' or 'startDate')
             is_buy_now_format = False
-            if reader.fieldnames:
+            if header:
                 # Use flexible column detection
                 domain_col = find_col(['domain', 'Domain'])
                 permalink_col = find_col(['permalink', 'Permalink'])
@@ -142,59 +609,58 @@ class CSVParserService:
             
             if is_buy_now_format:
                 # Parse Buy Now format: permalink, domain, price, extensions_taken
-                domain_key = find_col(['domain', 'Domain']) or 'domain'
-                price_key = find_col(['price', 'Price']) or 'price'
+                domain_i = column_index.get(find_col(['domain', 'Domain']))
+                price_i = column_index.get(find_col(['price', 'Price']))
+                parse_price = self._parse_price
+                parsed = skipped = failed = 0
                 
-                for row_num, row in enumerate(reader, start=2):
+                for row_num, row in rows:
                     try:
-                        domain_name = row.get(domain_key, '').strip()
+                        if len(row) < width:
+                            row += [None] * (width - len(row))
+                        
+                        domain_name = row[domain_i].strip() if domain_i is not None else ''
                         if not domain_name:
-                            logger.warning("Skipping row with empty domain", row=row_num)
+                            if skipped < _MAX_ROW_LOGS:
+                                logger.warning("Skipping row with empty domain", row=row_num)
+                            skipped += 1
                             continue
                         
-                        # Buy Now format has no dates - use far future date
-                        from datetime import datetime, timezone
-                        far_future_date = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
-                        
                         # Parse price (this is the buy now price)
-                        current_bid = self._parse_price(row.get(price_key, ''))
-                        
-                        # Store all original data in source_data
-                        source_data = {k: v for k, v in row.items()}
+                        current_bid = parse_price(row[price_i] if price_i is not None else '')
                         
+                        # Buy Now format has no dates - use far future date
                         auction = AuctionInput(
                             domain=domain_name,
                             start_date=None,  # Buy Now listings don't have start dates
-                            expiration_date=far_future_date,  # Use far future date (no expiration)
-                            end_date=far_future_date,  # Also set to far future date
+                            expiration_date=_FAR_FUTURE,  # Use far future date (no expiration)
+                            end_date=_FAR_FUTURE,  # Also set to far future date
                             current_bid=current_bid,
                             auction_site='namecheap',
-                            source_data=source_data
+                            source_data=_row_to_dict(header, row)
                         )
                         
                         yield auction
+                        parsed += 1
                         
                     except Exception as e:
-                        logger.warning("Failed to parse NameCheap Buy Now CSV row", row=row_num, error=str(e))
+                        if failed < _MAX_ROW_LOGS:
+                            logger.warning("Failed to parse NameCheap Buy Now CSV row", row=row_num, error=str(e))
+                        failed += 1
                         continue
                 
-                logger.info("Parsed NameCheap Buy Now CSV")
+                logger.info("Parsed NameCheap Buy Now CSV", parsed=parsed, skipped=skipped, failed=failed)
             else:
                 # Parse Market Sales format: url, name, startDate, endDate, price, ...
-                logger.info("Detected headers for Market Sales", headers=reader.fieldnames, filename=filename)
+                logger.info("Detected headers for Market Sales", headers=header, filename=filename)
                 
                 name_key = find_col(['name', 'Name', 'Domain', 'domain', 'domain_name']) or 'name'
                 
-                # Date keys
-                start_date_keys = ['startDate', 'StartDate', 'start_date', 'Start Date']
-                end_date_keys = ['endDate', 'EndDate', 'end_date', 'End Date', 'Auction End']
-                price_keys = ['price', 'Price', 'currentBid', 'current_bid', 'Current Bid']
-                
                 # Pre-fetch existing keys to avoid searching every row
-                found_start_key = find_col(start_date_keys)
-                found_end_key = find_col(end_date_keys)
-                found_price_key = find_col(price_keys)
-                found_url_key = find_col(['url', 'Url', 'URL', 'link', 'Link'])
+                found_start_key = find_col(self._NAMECHEAP_START_KEYS)
+                found_end_key = find_col(self._NAMECHEAP_END_KEYS)
+                found_price_key = find_col(self._NAMECHEAP_PRICE_KEYS)
+                found_url_key = find_col(self._NAMECHEAP_URL_KEYS)
                 
                 logger.info("Mapped columns for Market Sales", 
                            name_key=name_key, 
@@ -203,36 +669,47 @@ class CSVParserService:
                            price_key=found_price_key,
                            url_key=found_url_key)
 
-                skipped_log_count = 0
-                MAX_SKIPPED_LOGS = 10
+                name_i = column_index.get(name_key)
+                start_i = column_index.get(found_start_key)
+                end_i = column_index.get(found_end_key)
+                price_i = column_index.get(found_price_key)
+                url_i = column_index.get(found_url_key)
                 
-                for row_num, row in enumerate(reader, start=2):
+                # Bind the row parsers to locals so the loop skips attribute lookups
+                parse_date = self._parse_date
+                parse_price = self._parse_price
+
+                parsed = skipped = failed = 0
+                
+                for row_num, row in rows:
                     try:
-                        domain_name = row.get(name_key, '').strip()
+                        if len(row) < width:
+                            row += [None] * (width - len(row))
+                        
+                        domain_name = row[name_i].strip() if name_i is not None else ''
                         if not domain_name:
-                            if skipped_log_count < MAX_SKIPPED_LOGS:
+                            if skipped < _MAX_ROW_LOGS:
                                 logger.warning("Skipping row with empty name", row=row_num)
-                                skipped_log_count += 1
+                            skipped += 1
                             continue
                         
-                        # Parse dates with robust column checking
-                        start_date = self._parse_date(row.get(found_start_key, '')) if found_start_key else None
-                        end_date = self._parse_date(row.get(found_end_key, '')) if found_end_key else None
+                        # Parse the end date first: rows without one are skipped, so
+                        # the start date and price are only parsed for kept rows
+                        end_date = parse_date(row[end_i]) if end_i is not None else None
                         
                         if not end_date:
-                            if skipped_log_count < MAX_SKIPPED_LOGS:
-                                logger.warning("Skipping row without endDate", row=row_num, domain=domain_name, found_key=found_end_key, raw_value=row.get(found_end_key, '') if found_end_key else 'N/A')
-                                skipped_log_count += 1
+                            if skipped < _MAX_ROW_LOGS:
+                                logger.warning("Skipping row without endDate", row=row_num, domain=domain_name, found_key=found_end_key, raw_value=row[end_i] if end_i is not None else 'N/A')
+                            skipped += 1
                             continue
                         
+                        start_date = parse_date(row[start_i]) if start_i is not None else None
+                        
                         # Parse current_bid/price
-                        current_bid = self._parse_price(row.get(found_price_key, '')) if found_price_key else None
+                        current_bid = parse_price(row[price_i]) if price_i is not None else None
 
                         # Parse URL
-                        url = row.get(found_url_key, '').strip() if found_url_key else None
-                        
-                        # Store all original data in source_data
-                        source_data = {k: v for k, v in row.items()}
+                        url = row[url_i].strip() if url_i is not None else None
                         
                         auction = AuctionInput(
                             domain=domain_name,
@@ -241,19 +718,20 @@ class CSVParserService:
                             end_date=end_date,  # Also set for compatibility
                             current_bid=current_bid,
                             auction_site='namecheap',
-                            source_data=source_data,
+                            source_data=_row_to_dict(header, row),
                             link=url
                         )
                         
                         yield auction
+                        parsed += 1
                         
                     except Exception as e:
-                        if skipped_log_count < MAX_SKIPPED_LOGS:
+                        if failed < _MAX_ROW_LOGS:
                             logger.warning("Failed to parse CSV row", row=row_num, error=str(e))
-                            skipped_log_count += 1
+                        failed += 1
                         continue
                 
-                logger.info("Parsed Namecheap Market Sales CSV")
+                logger.info("Parsed Namecheap Market Sales CSV", parsed=parsed, skipped=skipped, failed=failed)
             
         except Exception as e:
             logger.error("Failed to parse Namecheap CSV", error=str(e), filename=filename)
@@ -268,65 +746,31 @@ class CSVParserService:
         """
         try:
             csv_file = content if is_handle else io.StringIO(content)
-            reader = csv.DictReader(csv_file)
+            chunks = _read_csv_chunks(csv_file)
+            first_chunk = next(chunks, None) if chunks is not None else None
             
             # Check if headers exist
-            if not reader.fieldnames:
+            if first_chunk is None:
                 logger.warning("GoDaddy CSV file has no headers or is empty")
                 return
             
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    # GoDaddy format may use different column names
-                    domain_name = row.get('Domain', '').strip() or row.get('domain', '').strip()
-                    if not domain_name:
-                        logger.warning("Skipping row with empty domain", row=row_num)
-                        continue
-                    
-                    # Try different date column name variations
-                    start_date = (
-                        self._parse_date(row.get('Start Date', '')) or
-                        self._parse_date(row.get('startDate', '')) or
-                        self._parse_date(row.get('start_date', ''))
-                    )
-                    
-                    end_date = (
-                        self._parse_date(row.get('End Date', '')) or
-                        self._parse_date(row.get('endDate', '')) or
-                        self._parse_date(row.get('end_date', '')) or
-                        self._parse_date(row.get('Expiration Date', '')) or
-                        self._parse_date(row.get('expirationDate', '')) or
-                        self._parse_date(row.get('expiration_date', ''))
-                    )
-                    
-                    if not end_date:
-                        logger.warning("Skipping row without expiration date", row=row_num, domain=domain_name)
-                        continue
-                    
-                    # Parse current_bid/price
-                    current_bid = self._parse_price(
-                        row.get('Price', '') or row.get('price', '') or 
-                        row.get('Current Bid', '') or row.get('currentBid', '') or 
-                        row.get('current_bid', '')
-                    )
-                    
-                    source_data = {k: v for k, v in row.items()}
-                    
-                    auction = AuctionInput(
-                        domain=domain_name,
-                        start_date=start_date,
-                        expiration_date=end_date,
-                        end_date=end_date,
-                        current_bid=current_bid,
-                        auction_site='godaddy',
-                        source_data=source_data
-                    )
-                    
-                    yield auction
-                    
-                except Exception as e:
-                    logger.warning("Failed to parse GoDaddy CSV row", row=row_num, error=str(e))
-                    continue
+            # GoDaddy format may use different column names; keep only the ones
+            # this file actually has so each chunk coalesces the minimum
+            columns = set(first_chunk.columns)
+            domain_cols = _pick(columns, self._GODADDY_DOMAIN_KEYS)
+            start_cols = _pick(columns, self._GODADDY_START_KEYS)
+            end_cols = _pick(columns, self._GODADDY_END_KEYS)
+            price_cols = _pick(columns, self._GODADDY_PRICE_KEYS)
+            
+            for df in itertools.chain([first_chunk], chunks):
+                yield from self._parse_dataframe(
+                    df,
+                    auction_site='godaddy',
+                    domain_cols=domain_cols,
+                    start_cols=start_cols,
+                    end_cols=end_cols,
+                    price_cols=price_cols
+                )
             
             logger.info("Parsed GoDaddy CSV")
             
@@ -350,21 +794,25 @@ class CSVParserService:
         try:
             csv_file = content if is_handle else io.StringIO(content)
 
-            # Debug: Read first bit of file to ensure it's not empty/garbled
+            # Debug: Read first bit of file to ensure it's not empty/garbled.
+            # Only worth the extra read + seek when debug logging is on.
             sample = "N/A"
-            if is_handle and hasattr(csv_file, 'readable') and csv_file.readable():
+            if (is_handle and logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+                    and hasattr(csv_file, 'readable') and csv_file.readable()):
                 # Peek start of file
                 pos = csv_file.tell()
                 sample = csv_file.read(500) # Read more bytes to see full header
                 csv_file.seek(pos)
-                logger.info("NameSilo CSV File Content Peek", sample=sample, position=pos)
+                logger.debug("NameSilo CSV File Content Peek", sample=sample, position=pos)
 
-            reader = csv.DictReader(csv_file)
+            chunks = _read_csv_chunks(csv_file)
+            first_chunk = next(chunks, None) if chunks is not None else None
 
             # Log available columns for debugging
-            if reader.fieldnames:
-                logger.info("NameSilo CSV columns detected", columns=list(reader.fieldnames))
-                fieldnames_lower = [f.lower() for f in reader.fieldnames]
+            if first_chunk is not None:
+                columns = list(first_chunk.columns)
+                logger.info("NameSilo CSV columns detected", columns=columns)
+                fieldnames_lower = [f.lower() for f in columns]
             else:
                 msg = f"NameSilo CSV has no header row or empty file. Content Start: '{sample}'"
                 logger.warning(msg)
@@ -372,142 +820,153 @@ class CSVParserService:
 
             # Detect format: active sales vs auction export
             is_active_sales_format = 'sale_type' in fieldnames_lower or 'buy_now' in fieldnames_lower
+            chunks = itertools.chain([first_chunk], chunks)
 
             if is_active_sales_format:
                 logger.info("Detected NameSilo active sales format")
-                yield from self._parse_namesilo_active_sales(reader)
+                yield from self._parse_namesilo_active_sales(chunks)
             else:
                 logger.info("Detected NameSilo auction export format")
-                yield from self._parse_namesilo_auction_export(reader, sample)
+                yield from self._parse_namesilo_auction_export(chunks, columns, sample)
 
         except Exception as e:
             logger.error("Failed to parse NameSilo CSV", error=str(e))
             raise
 
-    def _parse_namesilo_active_sales(self, reader) -> Iterator[AuctionInput]:
+    def _parse_namesilo_active_sales(self, chunks: Iterable[pd.DataFrame]) -> Iterator[AuctionInput]:
         """
         Parse NameSilo active sales CSV format from marketplaceActiveSalesOverview API
 
         Expected columns: Domain, Status, Reserve, Buy_Now, Portfolio, Sale_Type,
         Pay_Plan_Offered, End_Date, Auto_Extend_Days, Time_Remaining, Private, Active_Bid_Or_Offer
         """
-        count = 0
-        from datetime import datetime, timezone
+        count = failed = 0
 
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                # Get domain name
-                domain_name = row.get('Domain', '').strip()
-                if not domain_name:
-                    logger.warning("Skipping row with empty Domain", row=row_num)
-                    continue
+        for df in chunks:
+            # Get domain names
+            domains = _coalesce_columns(df, ['Domain'], strip=True)
+            has_domain = domains != ''
+            _log_skipped_rows("Skipping rows with empty Domain", (df.index[~has_domain] + 2).tolist())
+            df = df[has_domain]
 
-                # Parse end date from End_Date
-                end_date = self._parse_date(row.get('End_Date', ''))
-                if not end_date:
-                    # Default to far future if no end date
-                    end_date = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+            # Parse end dates from End_Date and buy_now prices as current_bid
+            end_dates = self._parse_date_columns(df, ['End_Date'])
+            current_bids = _map_unique(_coalesce_columns(df, ['Buy_Now']), _parse_namesilo_buy_now)
 
-                # Parse buy_now price as current_bid
+            rows = zip(
+                (df.index + 2).tolist(),
+                domains[has_domain].tolist(),
+                end_dates,
+                current_bids,
+                df.to_dict('records')
+            )
+            for row_num, domain_name, end_date, current_bid, row in rows:
                 try:
-                    buy_now_str = row.get('Buy_Now', '0').strip()
-                    # Remove non-numeric characters (like " (hidden)")
-                    buy_now_clean = ''.join(c for c in buy_now_str if c.isdigit() or c == '.')
-                    current_bid = float(buy_now_clean) if buy_now_clean else 0.0
-                except (ValueError, TypeError):
-                    current_bid = 0.0
+                    # Default to far future if no end date
+                    end_date = end_date or _FAR_FUTURE
 
-                # Build URL
-                url = f"https://www.namesilo.com/marketplace/domain-details/{domain_name}"
+                    # Build URL
+                    url = f"https://www.namesilo.com/marketplace/domain-details/{domain_name}"
 
-                auction = AuctionInput(
-                    domain=domain_name,
-                    start_date=None,  # Not provided in active sales
-                    expiration_date=end_date,
-                    end_date=end_date,
-                    current_bid=current_bid,
-                    auction_site='namesilo',
-                    source_data=row,
-                    link=url
-                )
+                    auction = AuctionInput(
+                        domain=domain_name,
+                        start_date=None,  # Not provided in active sales
+                        expiration_date=end_date,
+                        end_date=end_date,
+                        current_bid=current_bid,
+                        auction_site='namesilo',
+                        source_data=row,
+                        link=url
+                    )
 
-                yield auction
-                count += 1
+                    yield auction
+                    count += 1
 
-            except Exception as e:
-                logger.warning("Failed to parse NameSilo active sales row", row=row_num, error=str(e))
-                continue
+                except Exception as e:
+                    if failed < _MAX_ROW_LOGS:
+                        logger.warning("Failed to parse NameSilo active sales row", row=row_num, error=str(e))
+                    failed += 1
+                    continue
 
-        logger.info(f"Parsed {count} NameSilo active sales records")
+        logger.info(f"Parsed {count} NameSilo active sales records", failed=failed)
 
-    def _parse_namesilo_auction_export(self, reader, sample: str) -> Iterator[AuctionInput]:
+    def _parse_namesilo_auction_export(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        columns: List[str],
+        sample: str
+    ) -> Iterator[AuctionInput]:
         """
         Parse NameSilo auction export CSV format
 
         Expected columns: ID, Leader User ID, Owner User ID, Domain ID, Domain, Status, Type,
         Opening Bid, Current Bid, Max Bid, Domain Created On, Auction End, Url, Bid Count, External Provider
         """
-        count = 0
+        count = failed = 0
 
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                # NameSilo format uses "Domain" column (case-sensitive)
-                domain_name = row.get('Domain', '').strip()
-                if not domain_name:
-                    logger.warning("Skipping row with empty Domain", row=row_num, available_keys=list(row.keys()))
-                    continue
-
-                # Parse "Domain Created On" as start_date (when domain was created)
-                start_date = self._parse_date(row.get('Domain Created On', ''))
+        for df in chunks:
+            # NameSilo format uses "Domain" column (case-sensitive)
+            domains = _coalesce_columns(df, ['Domain'], strip=True)
+            has_domain = domains != ''
+            _log_skipped_rows(
+                "Skipping rows with empty Domain", (df.index[~has_domain] + 2).tolist(), available_keys=columns
+            )
+            df = df[has_domain]
 
-                # NameSilo auctions SHOULD have an expiration_date for auctions
-                # For 'Offer/Counter Offer' (Buy Now), it might be empty or valid
-                # Use "Auction End" if available, otherwise far future
-                auction_end_date = self._parse_date(row.get('Auction End', ''))
+            # Parse "Domain Created On" as start_date (when domain was created)
+            start_dates = self._parse_date_columns(df, ['Domain Created On'])
 
-                # Parse Current Bid
-                try:
-                    current_bid_str = row.get('Current Bid', '0').strip()
-                    current_bid = float(current_bid_str) if current_bid_str else 0.0
-                except (ValueError, TypeError):
-                    current_bid = 0.0
-
-                # Parse Url
-                url = row.get('Url', '').strip()
-                if not url and domain_name:
-                    # Fallback to domain-specific details page if URL is missing
-                    url = f"https://www.namesilo.com/marketplace/domain-details/{domain_name}"
+            # NameSilo auctions SHOULD have an expiration_date for auctions
+            # For 'Offer/Counter Offer' (Buy Now), it might be empty or valid
+            # Use "Auction End" if available, otherwise far future
+            auction_end_dates = self._parse_date_columns(df, ['Auction End'])
 
-                from datetime import datetime, timezone
-                far_future_date = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+            current_bids = _map_unique(_coalesce_columns(df, ['Current Bid']), _parse_namesilo_bid)
+            urls = _coalesce_columns(df, ['Url'], strip=True).tolist()
 
-                final_expiration_date = auction_end_date if auction_end_date else far_future_date
+            rows = zip(
+                (df.index + 2).tolist(),
+                domains[has_domain].tolist(),
+                start_dates,
+                auction_end_dates,
+                current_bids,
+                urls,
+                df.to_dict('records')
+            )
+            for row_num, domain_name, start_date, auction_end_date, current_bid, url, row in rows:
+                try:
+                    if not url:
+                        # Fallback to domain-specific details page if URL is missing
+                        url = f"https://www.namesilo.com/marketplace/domain-details/{domain_name}"
 
-                # For active auctions, we want the real end date
-                # For buy now/make offer, 2099 is appropriate if no date provided
+                    # For active auctions, we want the real end date
+                    # For buy now/make offer, 2099 is appropriate if no date provided
+                    final_expiration_date = auction_end_date if auction_end_date else _FAR_FUTURE
 
-                auction = AuctionInput(
-                    domain=domain_name,
-                    start_date=start_date,
-                    expiration_date=final_expiration_date,
-                    end_date=final_expiration_date,
-                    current_bid=current_bid,
-                    auction_site='namesilo',
-                    source_data=row,
-                    link=url
-                )
+                    auction = AuctionInput(
+                        domain=domain_name,
+                        start_date=start_date,
+                        expiration_date=final_expiration_date,
+                        end_date=final_expiration_date,
+                        current_bid=current_bid,
+                        auction_site='namesilo',
+                        source_data=row,
+                        link=url
+                    )
 
-                yield auction
-                count += 1
+                    yield auction
+                    count += 1
 
-            except Exception as e:
-                logger.warning("Failed to parse NameSilo CSV row", row=row_num, error=str(e))
-                continue
+                except Exception as e:
+                    if failed < _MAX_ROW_LOGS:
+                        logger.warning("Failed to parse NameSilo CSV row", row=row_num, error=str(e))
+                    failed += 1
+                    continue
 
         if count == 0:
-            logger.warning(f"No valid NameSilo auctions found. Headers: {reader.fieldnames}. Content Start: '{sample}'")
+            logger.warning(f"No valid NameSilo auctions found. Headers: {columns}. Content Start: '{sample}'")
 
-        logger.info("Parsed NameSilo CSV streaming started")
+        logger.info("Parsed NameSilo CSV streaming started", parsed=count, failed=failed)
     
     def parse_generic_csv(self, content: Any, auction_site: str, is_handle: bool = False) -> Iterator[AuctionInput]:
         """
@@ -517,76 +976,37 @@ class CSVParserService:
         """
         try:
             csv_file = content if is_handle else io.StringIO(content)
-            reader = csv.DictReader(csv_file)
+            chunks = _read_csv_chunks(csv_file)
+            first_chunk = next(chunks, None) if chunks is not None else None
             
             # Get column names
-            columns = reader.fieldnames or []
+            columns = list(first_chunk.columns) if first_chunk is not None else []
             logger.info("Generic CSV parser", columns=columns, auction_site=auction_site)
             
             # Find domain column
-            domain_col = None
-            for col in ['domain', 'name', 'Domain', 'Name', 'domain_name']:
-                if col in columns:
-                    domain_col = col
-                    break
+            domain_col = _resolve(columns, *self._GENERIC_DOMAIN_KEYS)
             
             # Find expiration date column
-            exp_date_col = None
-            for col in ['expiration_date', 'end_date', 'expirationDate', 'endDate', 
-                       'Expiration Date', 'End Date', 'expiration', 'expires']:
-                if col in columns:
-                    exp_date_col = col
-                    break
+            exp_date_col = _resolve(columns, *self._GENERIC_END_KEYS)
             
             # Find start date column
-            start_date_col = None
-            for col in ['start_date', 'startDate', 'Start Date', 'start']:
-                if col in columns:
-                    start_date_col = col
-                    break
+            start_date_col = _resolve(columns, *self._GENERIC_START_KEYS)
+            
+            # Find price column
+            price_col = _resolve(columns, *self._GENERIC_PRICE_KEYS)
             
             if not domain_col or not exp_date_col:
                 raise ValueError(f"Required columns not found. Need domain column and expiration date column. Found: {columns}")
             
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    domain_name = row.get(domain_col, '').strip()
-                    if not domain_name:
-                        continue
-                    
-                    end_date = self._parse_date(row.get(exp_date_col, ''))
-                    if not end_date:
-                        logger.warning("Skipping row without expiration date", row=row_num, domain=domain_name)
-                        continue
-                    
-                    start_date = self._parse_date(row.get(start_date_col, '')) if start_date_col else None
-                    
-                    # Find price column
-                    price_col = None
-                    for col in ['price', 'Price', 'currentBid', 'current_bid', 'Current Bid', 'bid', 'Bid']:
-                        if col in columns:
-                            price_col = col
-                            break
-                    
-                    current_bid = self._parse_price(row.get(price_col, '')) if price_col else None
-                    
-                    source_data = {k: v for k, v in row.items()}
-                    
-                    auction = AuctionInput(
-                        domain=domain_name,
-                        start_date=start_date,
-                        expiration_date=end_date,
-                        end_date=end_date,
-                        current_bid=current_bid,
-                        auction_site=auction_site.lower(),
-                        source_data=source_data
-                    )
-                    
-                    yield auction
-                    
-                except Exception as e:
-                    logger.warning("Failed to parse generic CSV row", row=row_num, error=str(e))
-                    continue
+            for df in itertools.chain([first_chunk], chunks):
+                yield from self._parse_dataframe(
+                    df,
+                    auction_site=auction_site.lower(),
+                    domain_cols=[domain_col],
+                    start_cols=[start_date_col] if start_date_col else [],
+                    end_cols=[exp_date_col],
+                    price_cols=[price_col] if price_col else []
+                )
             
             logger.info("Parsed generic CSV", auction_site=auction_site)
             
@@ -594,66 +1014,126 @@ class CSVParserService:
             logger.error("Failed to parse generic CSV", error=str(e))
             raise
     
+    def _parse_dataframe(
+        self,
+        df: pd.DataFrame,
+        auction_site: str,
+        domain_cols: List[str],
+        end_cols: List[str],
+        start_cols: List[str] = (),
+        price_cols: List[str] = ()
+    ) -> Iterator[AuctionInput]:
+        """
+        Convert one chunk of a CSV file into AuctionInput objects
+        
+        Works a column at a time instead of a row at a time: domain names are
+        stripped with vectorized string ops, rows without a domain are dropped
+        before any parsing, and each distinct date/price string is parsed once.
+        Candidate column lists are coalesced left to right, matching the
+        ``row.get(a) or row.get(b)`` fallbacks of the row-based parsers.
+        """
+        domains = _coalesce_columns(df, domain_cols, strip=True)
+        has_domain = domains != ''
+        _log_skipped_rows("Skipping rows with empty domain", (df.index[~has_domain] + 2).tolist())
+        
+        df = df[has_domain]
+        if df.empty:
+            return
+        
+        domains = domains[has_domain]
+        end_dates = self._parse_date_columns(df, end_cols)
+        
+        # Drop rows without an end date before any source_data dicts are built
+        has_end_date = pd.Series([end_date is not None for end_date in end_dates], index=df.index)
+        if not has_end_date.all():
+            _log_skipped_rows(
+                "Skipping rows without expiration date",
+                (df.index[~has_end_date] + 2).tolist(),
+                domains=domains[~has_end_date].head(_MAX_ROW_LOGS).tolist()
+            )
+            df = df[has_end_date]
+            domains = domains[has_end_date]
+            end_dates = [end_date for end_date in end_dates if end_date is not None]
+            if df.empty:
+                return
+        
+        start_dates = self._parse_date_columns(df, start_cols)
+        if price_cols:
+            current_bids = _map_unique(_coalesce_columns(df, price_cols), self._parse_price)
+        else:
+            current_bids = [None] * len(df)
+        
+        rows = zip(
+            (df.index + 2).tolist(),
+            domains.tolist(),
+            start_dates,
+            end_dates,
+            current_bids,
+            df.to_dict('records')
+        )
+        failed = 0
+        for row_num, domain_name, start_date, end_date, current_bid, source_data in rows:
+            try:
+                yield AuctionInput(
+                    domain=domain_name,
+                    start_date=start_date,
+                    expiration_date=end_date,
+                    end_date=end_date,
+                    current_bid=current_bid,
+                    auction_site=auction_site,
+                    source_data=source_data
+                )
+            except Exception as e:
+                if failed < _MAX_ROW_LOGS:
+                    logger.warning("Failed to parse CSV row", row=row_num, auction_site=auction_site, error=str(e))
+                failed += 1
+                continue
+        
+        if failed > _MAX_ROW_LOGS:
+            logger.warning("Failed to parse CSV rows", count=failed, auction_site=auction_site)
+    
+    def _parse_date_columns(self, df: pd.DataFrame, columns: List[str]) -> List[Optional[datetime]]:
+        """Parse candidate date columns, taking the first parseable value per row"""
+        result = [None] * len(df)
+        for col in columns:
+            if col not in df.columns:
+                continue
+            values = df[col].tolist()
+            parsed = {value: self._parse_date(value) for value in set(values)}
+            result = [current or parsed[value] for current, value in zip(result, values)]
+        return result
+    
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string in various formats"""
         if not date_str or date_str.strip() == '':
             return None
         
-        try:
-            # Try ISO format first
-            parsed = parse_iso_datetime(date_str)
-            if parsed:
-                return parsed
-            
-            # Try common date formats
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d',
-                '%m/%d/%Y',
-                '%d/%m/%Y',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%f',
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str.strip(), fmt)
-                except ValueError:
-                    continue
-            
-            logger.warning("Could not parse date", date_str=date_str)
-            return None
-            
-        except Exception as e:
-            logger.warning("Date parsing error", date_str=date_str, error=str(e))
-            return None
+        return _parse_date_cached(date_str)
     
     def _parse_price(self, price_str: str) -> Optional[float]:
         """Parse price/bid string, removing currency symbols and formatting"""
-        if not price_str or price_str.strip() == '':
-            return None
-        
-        try:
-            # Remove currency symbols, commas, and whitespace
-            import re
-            # Remove everything except digits, dots, and minus signs
-            cleaned = re.sub(r'[^\d.-]', '', str(price_str).strip())
-            if not cleaned or cleaned == '-' or cleaned == '.':
-                return None
-            return float(cleaned)
-        except (ValueError, TypeError) as e:
-            logger.warning("Could not parse price", price_str=price_str, error=str(e))
+        # Fast path: JSON sources may already hand us numbers
+        if isinstance(price_str, (int, float)) and not isinstance(price_str, bool):
+            return float(price_str)
+
+        if not price_str:
             return None
+
+        return _parse_price_cached(price_str)
     
-    def parse_godaddy_json(self, content: Any, is_handle: bool = False) -> List[AuctionInput]:
+    def parse_godaddy_json(self, content: Any, is_handle: bool = False) -> Iterator[AuctionInput]:
         """
         Parse GoDaddy JSON format
-        """
-        auctions = []
         
+        The document is decoded and validated up front, so malformed JSON raises
+        here; listings are then converted lazily like the CSV parsers.
+        """
         try:
-            # Parse JSON content
-            if is_handle:
+            # Parse JSON content (orjson is several times faster on large exports;
+            # its JSONDecodeError subclasses json.JSONDecodeError)
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(content.read() if is_handle else content)
+            elif is_handle:
                 data = json.load(content)
             else:
                 data = json.loads(content)
@@ -668,61 +1148,7 @@ class CSVParserService:
             
             logger.info("Parsing GoDaddy JSON", total_listings=len(listings))
             
-            for idx, listing in enumerate(listings, start=1):
-                try:
-                    if not isinstance(listing, dict):
-                        logger.warning("Skipping non-dict listing", index=idx)
-                        continue
-                    
-                    # Extract domain name
-                    domain_name = listing.get('domainName', '').strip()
-                    if not domain_name:
-                        logger.warning("Skipping listing with empty domainName", index=idx)
-                        continue
-                    
-                    # Parse auction end time (expiration_date)
-                    auction_end_time_str = listing.get('auctionEndTime', '')
-                    if not auction_end_time_str:
-                        logger.warning("Skipping listing without auctionEndTime", index=idx, domain=domain_name)
-                        continue
-                    
-                    expiration_date = self._parse_date(auction_end_time_str)
-                    if not expiration_date:
-                        logger.warning("Could not parse auctionEndTime", index=idx, domain=domain_name, date_str=auction_end_time_str)
-                        continue
-                    
-                    # Parse price (current bid)
-                    price_str = listing.get('price', '')
-                    current_bid = self._parse_price(price_str)
-                    
-                    # Extract link (auction URL)
-                    link = listing.get('link', '').strip() or None
-                    
-                    # Store all original data in source_data
-                    source_data = {k: v for k, v in listing.items()}
-                    # Also include meta information if available
-                    if 'meta' in data:
-                        source_data['_meta'] = data['meta']
-                    
-                    auction = AuctionInput(
-                        domain=domain_name,
-                        start_date=None,  # GoDaddy JSON doesn't provide start date
-                        expiration_date=expiration_date,
-                        end_date=expiration_date,
-                        current_bid=current_bid,
-                        auction_site='godaddy',
-                        source_data=source_data,
-                        link=link
-                    )
-                    
-                    auctions.append(auction)
-                    
-                except Exception as e:
-                    logger.warning("Failed to parse GoDaddy JSON listing", index=idx, error=str(e))
-                    continue
-            
-            logger.info("Parsed GoDaddy JSON", total_auctions=len(auctions))
-            return auctions
+            return self._parse_godaddy_listings(listings, data)
             
         except json.JSONDecodeError as e:
             logger.error("Failed to parse JSON", error=str(e))
@@ -730,6 +1156,77 @@ class CSVParserService:
         except Exception as e:
             logger.error("Failed to parse GoDaddy JSON", error=str(e))
             raise
+    
+    def _parse_godaddy_listings(self, listings: List[Any], data: Dict[str, Any]) -> Iterator[AuctionInput]:
+        """Convert decoded GoDaddy JSON listings into AuctionInput objects"""
+        # Resolved once for the whole file rather than per listing
+        meta = data.get('meta')
+        has_meta = 'meta' in data
+        parse_date = self._parse_date
+        parse_price = self._parse_price
+        count = skipped = failed = 0
+
+        for idx, listing in enumerate(listings, start=1):
+            try:
+                if not isinstance(listing, dict):
+                    if skipped < _MAX_ROW_LOGS:
+                        logger.warning("Skipping non-dict listing", index=idx)
+                    skipped += 1
+                    continue
+
+                # Extract domain name
+                domain_name = listing.get('domainName', '').strip()
+                if not domain_name:
+                    if skipped < _MAX_ROW_LOGS:
+                        logger.warning("Skipping listing with empty domainName", index=idx)
+                    skipped += 1
+                    continue
+
+                # Parse auction end time (expiration_date)
+                auction_end_time_str = listing.get('auctionEndTime', '')
+                if not auction_end_time_str:
+                    if skipped < _MAX_ROW_LOGS:
+                        logger.warning("Skipping listing without auctionEndTime", index=idx, domain=domain_name)
+                    skipped += 1
+                    continue
+
+                expiration_date = parse_date(auction_end_time_str)
+                if not expiration_date:
+                    if skipped < _MAX_ROW_LOGS:
+                        logger.warning("Could not parse auctionEndTime", index=idx, domain=domain_name, date_str=auction_end_time_str)
+                    skipped += 1
+                    continue
+
+                # Parse price (current bid)
+                price_str = listing.get('price', '')
+                current_bid = parse_price(price_str)
 
+                # Extract link (auction URL)
+                link = listing.get('link', '').strip() or None
 
+                # Store all original data in source_data, plus meta information if available.
+                # Listings come straight from the decoder, so they are only copied when
+                # _meta has to be added.
+                source_data = {**listing, '_meta': meta} if has_meta else listing
+
+                auction = AuctionInput(
+                    domain=domain_name,
+                    start_date=None,  # GoDaddy JSON doesn't provide start date
+                    expiration_date=expiration_date,
+                    end_date=expiration_date,
+                    current_bid=current_bid,
+                    auction_site='godaddy',
+                    source_data=source_data,
+                    link=link
+                )
+
+                yield auction
+                count += 1
+
+            except Exception as e:
+                if failed < _MAX_ROW_LOGS:
+                    logger.warning("Failed to parse GoDaddy JSON listing", index=idx, error=str(e))
+                failed += 1
+                continue
 
+        logger.info("Parsed GoDaddy JSON", total_auctions=count, skipped=skipped, failed=failed)
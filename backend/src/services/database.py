@@ -3,13 +3,21 @@ Database service for Supabase integration
 """
 
 from supabase import create_client, Client
-from typing import Optional, Dict, Any, List
+from postgrest import APIError, CountMethod, ReturnMethod
+from typing import Optional, Dict, Any, List, Callable, Awaitable, AsyncIterator
+import asyncio
+import copy
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import structlog
-import re
+from pydantic import ValidationError
 from datetime import datetime, timedelta, timezone
 
 from utils.config import get_settings
 from utils.date_utils import parse_iso_datetime
+from utils.ttl_cache import TTLCache
 from models.domain_analysis import (
     DomainAnalysisReport, RawDataCache, DataSource, 
     DetailedAnalysisData, AsyncTask, AsyncTaskStatus, 
@@ -18,16 +26,122 @@ from models.domain_analysis import (
     NamecheapDomain
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger()
 
 
+class _OrjsonClient(httpx.Client):
+    """
+    httpx client that encodes ``json=`` request bodies with orjson.
+    
+    PostgREST writes (report upserts in particular) send large JSONB payloads,
+    and httpx would otherwise serialize them with the stdlib json module.
+    Responses are already decoded by postgrest with pydantic-core.
+    """
+    
+    def build_request(self, method, url, *, content=None, json=None, headers=None, **kwargs):
+        if json is not None and content is None:
+            content = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            headers = httpx.Headers(headers)
+            headers['Content-Type'] = 'application/json'
+            json = None
+        return super().build_request(method, url, content=content, json=json, headers=headers, **kwargs)
+
+
 class DatabaseService:
     """Database service for Supabase operations"""
     
+    # DomainAnalysisReport fields persisted as columns of the reports table
+    _REPORT_COLUMNS = {
+        'analysis_timestamp', 'status', 'data_for_seo_metrics', 'wayback_machine_summary',
+        'llm_analysis', 'historical_data', 'raw_data_links', 'detailed_data_available',
+        'analysis_phase', 'progress_data', 'processing_time_seconds', 'error_message'
+    }
+    # Explicit column lists for the hot reads, so bookkeeping columns are not fetched
+    _REPORT_SELECT = ', '.join(['domain_name', *sorted(_REPORT_COLUMNS)])
+    _RAW_DATA_SELECT = 'api_source, json_data, expires_at'
+    _DETAILED_DATA_SELECT = 'id, domain_name, data_type, json_data, task_id, data_source, created_at, expires_at'
+    _ASYNC_TASK_SELECT = 'id, domain_name, task_id, task_type, status, created_at, completed_at, error_message, retry_count'
+    _MODE_CONFIG_SELECT = (
+        'id, domain_name, mode_preference, async_enabled, cache_ttl_hours, '
+        'manual_refresh_enabled, progress_indicators_enabled, created_at, updated_at'
+    )
+    # Model columns only: namecheap_domains also carries scoring columns the
+    # listings never read, and every column here maps onto a model field
+    _NAMECHEAP_SELECT = ', '.join(NamecheapDomain.model_fields)
+    _BULK_DOMAIN_SELECT = ', '.join(BulkDomainAnalysis.model_fields)
+    # Concurrent batch inserts per load_namecheap_domains call, kept below
+    # DB_MAX_CONCURRENT_REQUESTS so a CSV load leaves slots for other requests
+    _NAMECHEAP_INSERT_CONCURRENCY = 10
+    # Attempts per batch for transient failures (timeouts, 5xx, dropped
+    # connections), with exponential backoff from _NAMECHEAP_RETRY_DELAY_SECONDS
+    _NAMECHEAP_INSERT_ATTEMPTS = 3
+    _NAMECHEAP_RETRY_DELAY_SECONDS = 0.5
+    
     def __init__(self):
         self.settings = get_settings()
-        self.client: Optional[Client] = None
-        self._initialize_client()
+        self._cache_ttl = timedelta(seconds=self.settings.CACHE_TTL_SECONDS)
+        # The Supabase client is built on first access to .client (see below)
+        self._client: Optional[Client] = None
+        self._client_initialized = False
+        self._client_lock = threading.Lock()
+        # Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+        self._background_tasks: set = set()
+        # Short-lived read-through caches for the hot report/raw-cache lookups.
+        # Rows are cached (not model objects) so callers can mutate what they get.
+        self._report_cache = TTLCache(self.settings.DB_READ_CACHE_MAX_ENTRIES, self.settings.DB_READ_CACHE_TTL_SECONDS)
+        self._raw_cache = TTLCache(self.settings.DB_READ_CACHE_MAX_ENTRIES, self.settings.DB_READ_CACHE_TTL_SECONDS)
+        # Mode config rows keyed by ('mode', domain_name); {} marks "no config" so
+        # the common per-domain miss is cached too
+        self._mode_cache = TTLCache(self.settings.DB_READ_CACHE_MAX_ENTRIES, self.settings.DB_READ_CACHE_TTL_SECONDS)
+        # Single-domain lookups used per selected domain by the Namecheap analysis
+        # flow. Only hits are cached: a missing bulk domain is created right after
+        self._bulk_domain_cache = TTLCache(self.settings.DB_READ_CACHE_MAX_ENTRIES, self.settings.DB_READ_CACHE_TTL_SECONDS)
+        self._namecheap_cache = TTLCache(self.settings.DB_READ_CACHE_MAX_ENTRIES, self.settings.DB_READ_CACHE_TTL_SECONDS)
+        self._read_locks: Dict[Any, asyncio.Lock] = {}
+        # (domain, source) keys with a stale-while-revalidate refresh in flight
+        self._revalidating: set = set()
+        self.initialized = False
+        self._timeouts = {
+            'short': self.settings.DB_READ_TIMEOUT_SECONDS,
+            'medium': self.settings.DB_WRITE_TIMEOUT_SECONDS,
+            'long': self.settings.DB_BULK_TIMEOUT_SECONDS,
+        }
+        # Caps in-flight PostgREST calls below the httpx pool size so bursts
+        # (gathered deletes, fan-out reads) queue here instead of in the pool.
+        # Queries run on a dedicated executor of the same size, so a request
+        # that holds a slot always has a thread and never queues behind the
+        # loop's default executor (which is sized by CPU count).
+        self._request_slots = asyncio.Semaphore(self.settings.DB_MAX_CONCURRENT_REQUESTS)
+        self._query_executor = ThreadPoolExecutor(
+            max_workers=self.settings.DB_MAX_CONCURRENT_REQUESTS, thread_name_prefix='supabase'
+        )
+    
+    @property
+    def client(self) -> Optional[Client]:
+        """
+        Supabase client, created on first use.
+        
+        Building it sets up the SSL/httpx configuration, so constructing the
+        service stays cheap for code paths that never query. None if creation
+        failed.
+        """
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._initialize_client()
+                    self._client_initialized = True
+        return self._client
+    
+    @client.setter
+    def client(self, value: Optional[Client]):
+        self._client = value
+        self._client_initialized = True
     
     def _initialize_client(self):
         """Initialize Supabase client"""
@@ -42,24 +156,32 @@ class DatabaseService:
             
             import httpx
             
+            # HTTP/2 lets the worker threads running queries share one TLS connection
+            try:
+                import h2  # noqa: F401
+                HTTP2_AVAILABLE = True
+            except ImportError:
+                HTTP2_AVAILABLE = False
+            
             # Configure HTTP client with SSL verification setting and increased timeout
             # Increased to 600s (10m) to handle large CSV downloads which effectively prevents "peer closed connection" on slow networks
             timeout = httpx.Timeout(600.0, connect=60.0)
+            # Queries run concurrently on worker threads (see _execute), so keep
+            # enough warm connections for them instead of reconnecting per burst
+            limits = httpx.Limits(max_connections=30, max_keepalive_connections=20, keepalive_expiry=60.0)
             
             # Default options
             options = None
             
             if HAS_CLIENT_OPTIONS:
-                if not getattr(self.settings, 'SUPABASE_VERIFY_SSL', True):
+                verify = getattr(self.settings, 'SUPABASE_VERIFY_SSL', True)
+                if not verify:
                     # Disable SSL verification for self-hosted instances with self-signed certificates
-                    custom_client = httpx.Client(verify=False, timeout=timeout)
                     logger.warning("SSL verification disabled for Supabase client (self-hosted instance)")
-                    # Create client options with custom httpx client
-                    options = SyncClientOptions(httpx_client=custom_client)
-                else:
-                    # Create client with increased timeout
-                    custom_client = httpx.Client(timeout=timeout)
-                    options = SyncClientOptions(httpx_client=custom_client)
+                client_class = _OrjsonClient if ORJSON_AVAILABLE else httpx.Client
+                custom_client = client_class(verify=verify, timeout=timeout, limits=limits, http2=HTTP2_AVAILABLE)
+                # Create client options with custom httpx client
+                options = SyncClientOptions(httpx_client=custom_client)
             
             # Use service role key for admin operations
             key = self.settings.SUPABASE_SERVICE_ROLE_KEY
@@ -70,13 +192,13 @@ class DatabaseService:
                 logger.info("Initializing Supabase client with SERVICE_ROLE_KEY")
 
             if options:
-                self.client = create_client(
+                self._client = create_client(
                     self.settings.SUPABASE_URL,
                     key,
                     options=options
                 )
             else:
-                self.client = create_client(
+                self._client = create_client(
                     self.settings.SUPABASE_URL,
                     key
                 )
@@ -88,7 +210,7 @@ class DatabaseService:
             print(f"DEBUG: Failed to initialize Supabase client: {e}")
             logger.error("Failed to initialize Supabase client", error=str(e))
             # Fallback to None for now
-            self.client = None
+            self._client = None
             logger.warning("Supabase client disabled, using fallback mode")
     
     async def init_database(self):
@@ -103,24 +225,40 @@ class DatabaseService:
             # Note: We don't raise here to allow health checks to still pass if table creation is slow
             try:
                 await self._create_tables()
-                await self._create_indexes()
                 logger.info("Database initialization completed")
             except Exception as e:
                 logger.warning("Table/Index creation failed, but client is active", error=str(e))
+            
+            await self._warm_up_connection()
                 
         except Exception as e:
             logger.error("Database initialization failed", error=str(e))
             # Don't raise, allowing the app to start and report 'degraded' in health checks
     
+    async def _warm_up_connection(self):
+        """
+        Open the pooled connection to PostgREST at startup.
+        
+        The first request otherwise pays the TCP + TLS (and HTTP/2) handshake;
+        with HTTP/2 later requests are multiplexed over this connection.
+        """
+        try:
+            await self._execute(self.client.table('reports').select('id').limit(1), 'short')
+            logger.debug("Supabase connection warmed up")
+        except Exception as e:
+            logger.warning("Supabase connection warm-up failed", error=str(e))
+    
     async def _create_tables(self):
-        """Create database tables"""
-        # This would typically be done via Supabase migrations
-        # For now, we'll assume tables exist or create them via SQL
+        """Create database tables and indexes"""
+        # The schema is owned by supabase/migrations, which run once per deploy.
+        # The rpc builder below is intentionally never executed: running this DDL
+        # from every worker on startup would only add round trips and race with
+        # the migrations. It is kept as a readable summary of the core tables.
         tables_sql = """
         -- Create reports table
         CREATE TABLE IF NOT EXISTS reports (
             id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-            domain_name VARCHAR(255) NOT NULL UNIQUE,
+            domain_name VARCHAR(255) NOT NULL UNIQUE CHECK (domain_name = LOWER(domain_name)),
             analysis_timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
             status VARCHAR(50) NOT NULL DEFAULT 'pending',
             data_for_seo_metrics JSONB,
@@ -137,7 +275,7 @@ class DatabaseService:
         -- Create raw_data_cache table
         CREATE TABLE IF NOT EXISTS raw_data_cache (
             id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-            domain_name VARCHAR(255) NOT NULL,
+            domain_name VARCHAR(255) NOT NULL CHECK (domain_name = LOWER(domain_name)),
             api_source VARCHAR(50) NOT NULL,
             json_data JSONB NOT NULL,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -146,50 +284,136 @@ class DatabaseService:
         );
         
         -- Create indexes
-        CREATE INDEX IF NOT EXISTS idx_reports_domain_name ON reports(domain_name);
-        CREATE INDEX IF NOT EXISTS idx_reports_status ON reports(status);
+        CREATE INDEX IF NOT EXISTS idx_reports_domain_cover ON reports(domain_name)
+            INCLUDE (status, processing_time_seconds, analysis_timestamp, error_message);
+        CREATE INDEX IF NOT EXISTS idx_reports_status_active ON reports(status, created_at DESC)
+            WHERE status IN ('pending', 'in_progress', 'failed');
         CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports(created_at);
         CREATE INDEX IF NOT EXISTS idx_raw_data_cache_domain_source ON raw_data_cache(domain_name, api_source);
-        CREATE INDEX IF NOT EXISTS idx_raw_data_cache_expires_at ON raw_data_cache(expires_at);
+        CREATE INDEX IF NOT EXISTS idx_raw_data_cache_expiring ON raw_data_cache(expires_at)
+            WHERE expires_at IS NOT NULL;
         """
         
         # Execute SQL via Supabase
         result = self.client.rpc('exec_sql', {'sql': tables_sql})
-        logger.info("Database tables created/verified")
+        logger.debug("Database schema is managed by migrations")
+    
+    async def _execute(self, query, timeout: str = 'medium'):
+        """
+        Run a PostgREST query on a worker thread, waiting at most the given tier's timeout.
+        
+        The Supabase client is synchronous, so calling .execute() directly in an
+        async method blocks the event loop for the whole HTTP round trip. The
+        shared httpx client keeps a long timeout for storage downloads, so the
+        per-tier bound is applied here: 'short' for point lookups, 'medium' for
+        writes and 'long' for bulk reads and multi-row writes. The timeout
+        starts once the query holds a request slot. On timeout the caller gets
+        asyncio.TimeoutError; the abandoned request finishes on its thread and
+        keeps its slot until then, so slow requests still count towards the cap.
+        """
+        if self._request_slots.locked():
+            logger.warning("Supabase request limit reached, queueing", limit=self.settings.DB_MAX_CONCURRENT_REQUESTS)
+        await self._request_slots.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._query_executor.submit(query.execute)
+        except BaseException:
+            self._request_slots.release()
+            raise
+        
+        def release_slot(_):
+            try:
+                loop.call_soon_threadsafe(self._request_slots.release)
+            except RuntimeError:
+                pass  # Event loop already closed
+        
+        # Released when the thread finishes, not when the awaiting coroutine
+        # is cancelled by the timeout
+        future.add_done_callback(release_slot)
+        return await asyncio.wait_for(asyncio.wrap_future(future), self._timeouts[timeout])
+    
+    @staticmethod
+    def _normalize_domain(domain_name: str) -> str:
+        """Canonical form for reports/raw_data_cache keys, so lookups hit the domain_name index"""
+        return domain_name.strip().lower()
+    
+    async def _cached_read(self, cache: TTLCache, key: Any, fetch):
+        """
+        Return ``cache[key]``, calling ``fetch()`` on a miss.
+        
+        Concurrent misses for the same key wait on one lock, so only the first
+        coroutine queries Supabase. None results are not cached.
+        """
+        value = cache.get(key)
+        if value is not None:
+            return value
+        
+        lock = self._read_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = cache.get(key)
+                if value is None:
+                    value = await fetch()
+                    if value is not None:
+                        cache.set(key, value)
+                return value
+        finally:
+            if not lock.locked():
+                self._read_locks.pop(key, None)
+    
+    @staticmethod
+    def _row_to_bulk_domain(row: Dict[str, Any]) -> BulkDomainAnalysis:
+        """
+        Build a BulkDomainAnalysis from a bulk_domain_analysis row.
+        
+        An empty or unparseable backlinks_bulk_page_summary is dropped (with a
+        warning) rather than failing the whole record.
+        """
+        summary = row.get('backlinks_bulk_page_summary')
+        if summary is not None and not summary:
+            row = {**row, 'backlinks_bulk_page_summary': None}
+        try:
+            return BulkDomainAnalysis.model_validate(row)
+        except ValidationError as e:
+            if summary is None:
+                raise
+            logger.warning("Failed to parse summary data", domain=row.get('domain_name'), error=str(e))
+            return BulkDomainAnalysis.model_validate({**row, 'backlinks_bulk_page_summary': None})
+    
+    def _invalidate_raw_cache(self, domain_name: str, api_sources=DataSource):
+        for api_source in api_sources:
+            self._raw_cache.pop((domain_name, api_source.value))
     
-    async def _create_indexes(self):
-        """Create database indexes for performance"""
-        # Indexes are created in _create_tables method
-        pass
+    def _run_in_background(self, coro) -> asyncio.Task:
+        """Schedule a coroutine without awaiting it; failures are logged by the coroutine itself"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+    
+    def _on_background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled():
+            # Retrieve the exception so asyncio does not report it as never retrieved
+            task.exception()
     
     async def save_report(self, report: DomainAnalysisReport) -> str:
         """Save domain analysis report to database"""
+        domain_name = self._normalize_domain(report.domain_name)
         try:
-            report_data = report.dict()
-            report_data['analysis_timestamp'] = report_data['analysis_timestamp'].isoformat()
-            
-            # Convert datetime objects in nested models to ISO strings
-            if report_data.get('wayback_machine_summary') and report_data['wayback_machine_summary'].get('last_capture_date'):
-                if hasattr(report_data['wayback_machine_summary']['last_capture_date'], 'isoformat'):
-                    report_data['wayback_machine_summary']['last_capture_date'] = report_data['wayback_machine_summary']['last_capture_date'].isoformat()
-            
-            result = self.client.table('reports').upsert({
-                'domain_name': report.domain_name,
-                'analysis_timestamp': report_data['analysis_timestamp'],
-                'status': report.status.value,
-                'data_for_seo_metrics': report_data.get('data_for_seo_metrics'),
-                'wayback_machine_summary': report_data.get('wayback_machine_summary'),
-                'llm_analysis': report_data.get('llm_analysis'),
-                'historical_data': report.historical_data.model_dump(mode='json') if report.historical_data else None,
-                'raw_data_links': report_data.get('raw_data_links'),
-                'detailed_data_available': report_data.get('detailed_data_available'),
-                'analysis_phase': report_data.get('analysis_phase'),
-                'progress_data': report.progress_data.dict() if report.progress_data else None,
-                'processing_time_seconds': report.processing_time_seconds,
-                'error_message': report.error_message,
-                'updated_at': datetime.utcnow().isoformat()
-            }, on_conflict='domain_name').execute()
+            # One pass straight to JSON-safe types (datetimes, enums and nested
+            # models included) instead of dict() plus per-field conversions
+            report_data = report.model_dump(mode='json', include=self._REPORT_COLUMNS)
+            report_data['domain_name'] = domain_name
+            # updated_at is set by Postgres: the column default on insert and
+            # the update_reports_updated_at trigger on conflict
+            
+            # Only the id is needed back, not the full row with its JSONB columns
+            result = await self._execute(
+                self.client.table('reports').upsert(report_data, on_conflict='domain_name').select('id')
+            )
             
+            self._report_cache.pop(domain_name)
             report_id = result.data[0]['id'] if result.data else None
             logger.info("Report saved successfully", domain=report.domain_name, report_id=report_id)
             return report_id
@@ -200,14 +424,12 @@ class DatabaseService:
     
     async def get_report(self, domain_name: str) -> Optional[DomainAnalysisReport]:
         """Get domain analysis report by domain name"""
+        domain_name = self._normalize_domain(domain_name)
         try:
-            result = self.client.table('reports').select('*').eq('domain_name', domain_name).execute()
-            
-            if not result.data:
+            report_data = await self._cached_read(self._report_cache, domain_name, lambda: self._fetch_report_row(domain_name))
+            if report_data is None:
                 return None
             
-            report_data = result.data[0]
-            
             # Convert back to DomainAnalysisReport object
             report = DomainAnalysisReport(
                 domain_name=report_data['domain_name'],
@@ -225,73 +447,192 @@ class DatabaseService:
                 error_message=report_data.get('error_message')
             )
             
-            logger.info("Report retrieved successfully", domain=domain_name)
+            logger.debug("Report retrieved successfully", domain=domain_name)
             return report
             
         except Exception as e:
             logger.error("Failed to get report", domain=domain_name, error=str(e))
             raise
     
-    async def save_raw_data(self, domain_name: str, api_source: DataSource, data: Dict[str, Any]) -> str:
-        """Save raw API data to cache, merging with existing data if present"""
+    async def get_report_status(self, domain_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get just the status columns of a report, for polling endpoints.
+        
+        Served by the idx_reports_domain_cover index without reading the
+        report's JSONB columns.
+        """
+        domain_name = self._normalize_domain(domain_name)
+        try:
+            result = await self._execute(
+                self.client.table('reports')
+                .select('status, processing_time_seconds, analysis_timestamp, error_message')
+                .eq('domain_name', domain_name),
+                'short'
+            )
+            return result.data[0] if result.data else None
+            
+        except Exception as e:
+            logger.error("Failed to get report status", domain=domain_name, error=str(e))
+            raise
+    
+    async def _fetch_report_row(self, domain_name: str) -> Optional[Dict[str, Any]]:
+        result = await self._execute(self.client.table('reports').select(self._REPORT_SELECT).eq('domain_name', domain_name), 'short')
+        return result.data[0] if result.data else None
+    
+    async def save_raw_data(
+        self,
+        domain_name: str,
+        api_source: DataSource,
+        data: Dict[str, Any],
+        ttl_seconds: Optional[int] = None,
+        merge: bool = True
+    ) -> str:
+        """
+        Save raw API data to cache, merging with existing data if present
+        
+        ``ttl_seconds`` overrides CACHE_TTL_SECONDS; ``merge=False`` replaces
+        the cached entry instead of merging into it.
+        """
+        domain_name = self._normalize_domain(domain_name)
         try:
-            settings = get_settings()
-            expires_at = datetime.utcnow() + timedelta(seconds=settings.CACHE_TTL_SECONDS)
+            ttl = timedelta(seconds=ttl_seconds) if ttl_seconds is not None else self._cache_ttl
+            expires_at = datetime.now(timezone.utc) + ttl
             
             # Try to get existing data for merging
-            existing = await self.get_raw_data(domain_name, api_source)
+            existing = await self.get_raw_data(domain_name, api_source) if merge else None
             if existing:
                 # Merge new data into existing
                 logger.debug("Merging new raw data into existing cache", domain=domain_name, source=api_source.value)
                 existing.update(data)
                 data = existing
             
-            result = self.client.table('raw_data_cache').upsert({
+            result = await self._execute(self.client.table('raw_data_cache').upsert({
                 'domain_name': domain_name,
                 'api_source': api_source.value,
                 'json_data': data,
                 'expires_at': expires_at.isoformat()
-            }, on_conflict='domain_name,api_source').execute()
+            }, on_conflict='domain_name,api_source').select('id'))
             
+            self._invalidate_raw_cache(domain_name, [api_source])
             cache_id = result.data[0]['id'] if result.data else None
-            logger.info("Raw data cached successfully", domain=domain_name, source=api_source.value)
+            logger.debug("Raw data cached successfully", domain=domain_name, source=api_source.value)
             return cache_id
             
         except Exception as e:
             logger.error("Failed to save raw data", domain=domain_name, source=api_source.value, error=str(e))
             raise
     
-    async def get_raw_data(self, domain_name: str, api_source: DataSource) -> Optional[Dict[str, Any]]:
-        """Get cached raw API data"""
+    async def get_raw_data(
+        self,
+        domain_name: str,
+        api_source: DataSource,
+        revalidate: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached raw API data
+        
+        If ``revalidate`` is given, data that expired less than
+        RAW_DATA_STALE_WINDOW_SECONDS ago is still returned, and ``revalidate()``
+        (which must fetch and save fresh data) runs in the background, at most
+        once per key at a time.
+        """
+        domain_name = self._normalize_domain(domain_name)
         try:
-            result = self.client.table('raw_data_cache').select('*').eq('domain_name', domain_name).eq('api_source', api_source.value).execute()
-            
-            if not result.data:
+            cache_data = await self._cached_read(
+                self._raw_cache,
+                (domain_name, api_source.value),
+                lambda: self._fetch_raw_data_row(domain_name, api_source)
+            )
+            if cache_data is None:
                 return None
             
-            cache_data = result.data[0]
-            
             # Check if data is expired
-            if cache_data.get('expires_at'):
-                expires_at = parse_iso_datetime(cache_data['expires_at'])
-                # Make utcnow timezone-aware for comparison
-                now_utc = datetime.utcnow().replace(tzinfo=expires_at.tzinfo)
-                if now_utc > expires_at:
-                    # Delete expired data
-                    await self.delete_raw_data(domain_name, api_source)
-                    return None
-            
-            logger.info("Raw data retrieved from cache", domain=domain_name, source=api_source.value)
-            return cache_data['json_data']
+            if self._is_cache_expired(cache_data):
+                if revalidate is not None and self._seconds_past_expiry(cache_data) < self.settings.RAW_DATA_STALE_WINDOW_SECONDS:
+                    self._revalidate_in_background(domain_name, api_source, revalidate)
+                    logger.info("Serving stale raw data while revalidating", domain=domain_name, source=api_source.value)
+                    return copy.deepcopy(cache_data['json_data'])
+                
+                # Delete expired data without making the caller wait for it
+                self._run_in_background(self._delete_expired_raw_data(domain_name, api_source))
+                return None
+            
+            logger.debug("Raw data retrieved from cache", domain=domain_name, source=api_source.value)
+            return copy.deepcopy(cache_data['json_data'])
             
         except Exception as e:
             logger.error("Failed to get raw data", domain=domain_name, source=api_source.value, error=str(e))
             raise
     
+    async def _fetch_raw_data_row(self, domain_name: str, api_source: DataSource) -> Optional[Dict[str, Any]]:
+        result = await self._execute(
+            self.client.table('raw_data_cache').select(self._RAW_DATA_SELECT)
+            .eq('domain_name', domain_name).eq('api_source', api_source.value),
+            'short'
+        )
+        return result.data[0] if result.data else None
+    
+    @staticmethod
+    def _seconds_past_expiry(cache_data: Dict[str, Any]) -> float:
+        """Seconds since a cache row's expires_at (negative while fresh)"""
+        if not cache_data.get('expires_at'):
+            return float('-inf')
+        expires_at = parse_iso_datetime(cache_data['expires_at'])
+        # timestamptz columns come back with an offset; treat anything naive as UTC
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - expires_at).total_seconds()
+    
+    @classmethod
+    def _is_cache_expired(cls, cache_data: Dict[str, Any]) -> bool:
+        """Check a raw_data_cache row's expires_at against the current time"""
+        return cls._seconds_past_expiry(cache_data) > 0
+    
+    def _revalidate_in_background(self, domain_name: str, api_source: DataSource, revalidate: Callable[[], Awaitable[Any]]):
+        key = (domain_name, api_source.value)
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        
+        async def run():
+            try:
+                await revalidate()
+            except Exception as e:
+                logger.error("Failed to revalidate raw data", domain=domain_name, source=api_source.value, error=str(e))
+                raise
+            finally:
+                self._revalidating.discard(key)
+        
+        self._run_in_background(run())
+    
+    async def _delete_expired_raw_data(self, domain_name: str, api_source: DataSource):
+        """
+        Delete an expired cache row.
+        
+        Runs in the background, so it only removes the row if it is still expired;
+        a fresh row saved in the meantime is left alone.
+        """
+        self._invalidate_raw_cache(domain_name, [api_source])
+        try:
+            await self._execute(
+                self.client.table('raw_data_cache').delete(returning=ReturnMethod.minimal)
+                .eq('domain_name', domain_name)
+                .eq('api_source', api_source.value)
+                .lt('expires_at', datetime.now(timezone.utc).isoformat())
+            )
+        except Exception as e:
+            logger.error("Failed to delete expired raw data", domain=domain_name, source=api_source.value, error=str(e))
+            raise
+    
     async def delete_raw_data(self, domain_name: str, api_source: DataSource):
         """Delete cached raw data"""
+        domain_name = self._normalize_domain(domain_name)
         try:
-            self.client.table('raw_data_cache').delete().eq('domain_name', domain_name).eq('api_source', api_source.value).execute()
+            await self._execute(
+                self.client.table('raw_data_cache').delete(returning=ReturnMethod.minimal)
+                .eq('domain_name', domain_name).eq('api_source', api_source.value)
+            )
+            self._invalidate_raw_cache(domain_name, [api_source])
             logger.info("Raw data deleted from cache", domain=domain_name, source=api_source.value)
         except Exception as e:
             logger.error("Failed to delete raw data", domain=domain_name, source=api_source.value, error=str(e))
@@ -300,8 +641,17 @@ class DatabaseService:
     async def cleanup_expired_data(self):
         """Clean up expired cached data"""
         try:
-            result = self.client.table('raw_data_cache').delete().lt('expires_at', datetime.utcnow().isoformat()).execute()
-            logger.info("Expired data cleaned up", deleted_count=len(result.data) if result.data else 0)
+            # Only the row count comes back (Content-Range), not every deleted row
+            now = datetime.now(timezone.utc).isoformat()
+            deleted_count = 0
+            for table in ('raw_data_cache', 'detailed_analysis_data'):
+                result = await self._execute(
+                    self.client.table(table).delete(count=CountMethod.exact, returning=ReturnMethod.minimal).lt('expires_at', now),
+                    'long'
+                )
+                deleted_count += result.count or 0
+            self._raw_cache.clear()
+            logger.info("Expired data cleaned up", deleted_count=deleted_count)
         except Exception as e:
             logger.error("Failed to cleanup expired data", error=str(e))
             raise
@@ -314,14 +664,14 @@ class DatabaseService:
             if detailed_data.expires_at:
                 expires_at = detailed_data.expires_at.isoformat()
             
-            result = self.client.table('detailed_analysis_data').upsert({
+            result = await self._execute(self.client.table('detailed_analysis_data').upsert({
                 'domain_name': detailed_data.domain_name,
                 'data_type': detailed_data.data_type.value,
                 'json_data': detailed_data.json_data,
                 'task_id': detailed_data.task_id,
                 'data_source': detailed_data.data_source,
                 'expires_at': expires_at
-            }, on_conflict='domain_name,data_type').execute()
+            }, on_conflict='domain_name,data_type').select('id'), 'medium')
             
             data_id = result.data[0]['id'] if result.data else None
             logger.info("Detailed data saved successfully", 
@@ -340,7 +690,11 @@ class DatabaseService:
     async def get_detailed_data(self, domain_name: str, data_type: DetailedDataType) -> Optional[DetailedAnalysisData]:
         """Get detailed analysis data by domain and type"""
         try:
-            result = self.client.table('detailed_analysis_data').select('*').eq('domain_name', domain_name).eq('data_type', data_type.value).execute()
+            result = await self._execute(
+                self.client.table('detailed_analysis_data').select(self._DETAILED_DATA_SELECT)
+                .eq('domain_name', domain_name).eq('data_type', data_type.value),
+                'short'
+            )
             
             if not result.data:
                 return None
@@ -348,12 +702,10 @@ class DatabaseService:
             data = result.data[0]
             
             # Check if data is expired
-            if data.get('expires_at'):
-                expires_at = parse_iso_datetime(data['expires_at'])
-                now_utc = datetime.utcnow().replace(tzinfo=expires_at.tzinfo)
-                if now_utc > expires_at:
-                    await self.delete_detailed_data(domain_name, data_type)
-                    return None
+            if self._seconds_past_expiry(data) > 0:
+                # Nothing to return either way, so don't make the caller wait for the delete
+                self._run_in_background(self._delete_expired_detailed_data(domain_name, data_type))
+                return None
             
             detailed_data = DetailedAnalysisData(
                 id=data['id'],
@@ -366,7 +718,7 @@ class DatabaseService:
                 expires_at=parse_iso_datetime(data.get('expires_at'))
             )
             
-            logger.info("Detailed data retrieved successfully", domain=domain_name, data_type=data_type.value)
+            logger.debug("Detailed data retrieved successfully", domain=domain_name, data_type=data_type.value)
             return detailed_data
             
         except Exception as e:
@@ -376,24 +728,37 @@ class DatabaseService:
     async def delete_detailed_data(self, domain_name: str, data_type: DetailedDataType):
         """Delete detailed analysis data"""
         try:
-            self.client.table('detailed_analysis_data').delete().eq('domain_name', domain_name).eq('data_type', data_type.value).execute()
+            await self._execute(self.client.table('detailed_analysis_data').delete(returning=ReturnMethod.minimal).eq('domain_name', domain_name).eq('data_type', data_type.value), 'medium')
             logger.info("Detailed data deleted", domain=domain_name, data_type=data_type.value)
         except Exception as e:
             logger.error("Failed to delete detailed data", domain=domain_name, data_type=data_type.value, error=str(e))
             raise
     
+    async def _delete_expired_detailed_data(self, domain_name: str, data_type: DetailedDataType):
+        """Delete a detailed data row if it is still expired (a fresh save in the meantime is kept)"""
+        try:
+            await self._execute(
+                self.client.table('detailed_analysis_data').delete(returning=ReturnMethod.minimal)
+                .eq('domain_name', domain_name)
+                .eq('data_type', data_type.value)
+                .lt('expires_at', datetime.now(timezone.utc).isoformat())
+            )
+        except Exception as e:
+            logger.error("Failed to delete expired detailed data", domain=domain_name, data_type=data_type.value, error=str(e))
+            raise
+    
     # Async Task Tracking Methods
     async def save_async_task(self, async_task: AsyncTask) -> str:
         """Save async task to database"""
         try:
-            result = self.client.table('async_tasks').upsert({
+            result = await self._execute(self.client.table('async_tasks').upsert({
                 'domain_name': async_task.domain_name,
                 'task_id': async_task.task_id,
                 'task_type': async_task.task_type.value,
                 'status': async_task.status.value,
                 'error_message': async_task.error_message,
                 'retry_count': async_task.retry_count
-            }, on_conflict='task_id').execute()
+            }, on_conflict='task_id').select('id'), 'medium')
             
             task_id = result.data[0]['id'] if result.data else None
             logger.info("Async task saved successfully", 
@@ -412,7 +777,10 @@ class DatabaseService:
     async def get_async_task(self, task_id: str) -> Optional[AsyncTask]:
         """Get async task by task ID"""
         try:
-            result = self.client.table('async_tasks').select('*').eq('task_id', task_id).execute()
+            result = await self._execute(
+                self.client.table('async_tasks').select(self._ASYNC_TASK_SELECT).eq('task_id', task_id).limit(1),
+                'short'
+            )
             
             if not result.data:
                 return None
@@ -431,7 +799,7 @@ class DatabaseService:
                 retry_count=task_data.get('retry_count', 0)
             )
             
-            logger.info("Async task retrieved successfully", task_id=task_id)
+            logger.debug("Async task retrieved successfully", task_id=task_id)
             return async_task
             
         except Exception as e:
@@ -441,7 +809,12 @@ class DatabaseService:
     async def get_pending_task(self, domain_name: str, task_type: DetailedDataType) -> Optional[AsyncTask]:
         """Get pending async task for domain and type"""
         try:
-            result = self.client.table('async_tasks').select('*').eq('domain_name', domain_name).eq('task_type', task_type.value).eq('status', 'pending').execute()
+            result = await self._execute(
+                self.client.table('async_tasks').select(self._ASYNC_TASK_SELECT)
+                .eq('domain_name', domain_name).eq('task_type', task_type.value).eq('status', 'pending')
+                .order('created_at').limit(1),
+                'short'
+            )
             
             if not result.data:
                 return None
@@ -460,7 +833,7 @@ class DatabaseService:
                 retry_count=task_data.get('retry_count', 0)
             )
             
-            logger.info("Pending async task retrieved", domain=domain_name, task_type=task_type.value)
+            logger.debug("Pending async task retrieved", domain=domain_name, task_type=task_type.value)
             return async_task
             
         except Exception as e:
@@ -472,15 +845,15 @@ class DatabaseService:
         try:
             update_data = {
                 'status': status.value,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': datetime.now(timezone.utc).isoformat()
             }
             
             if status == AsyncTaskStatus.COMPLETED:
-                update_data['completed_at'] = datetime.utcnow().isoformat()
+                update_data['completed_at'] = datetime.now(timezone.utc).isoformat()
             elif status == AsyncTaskStatus.FAILED and error_message:
                 update_data['error_message'] = error_message
             
-            self.client.table('async_tasks').update(update_data).eq('task_id', task_id).execute()
+            await self._execute(self.client.table('async_tasks').update(update_data).eq('task_id', task_id), 'medium')
             
             logger.info("Async task status updated", task_id=task_id, status=status.value)
             
@@ -492,20 +865,14 @@ class DatabaseService:
     async def get_mode_config(self, domain_name: str = None) -> Optional[AnalysisModeConfig]:
         """Get analysis mode configuration for domain or global"""
         try:
-            query = self.client.table('analysis_mode_config').select('*')
-            
-            if domain_name:
-                query = query.eq('domain_name', domain_name)
-            else:
-                query = query.is_('domain_name', 'null')
-            
-            result = query.execute()
-            
-            if not result.data:
+            config_data = await self._cached_read(
+                self._mode_cache,
+                ('mode', domain_name or None),
+                lambda: self._fetch_mode_config_row(domain_name)
+            )
+            if not config_data:
                 return None
             
-            config_data = result.data[0]
-            
             config = AnalysisModeConfig(
                 id=config_data['id'],
                 domain_name=config_data.get('domain_name'),
@@ -518,24 +885,36 @@ class DatabaseService:
                 updated_at=parse_iso_datetime(config_data.get('updated_at'))
             )
             
-            logger.info("Mode config retrieved", domain=domain_name)
+            logger.debug("Mode config retrieved", domain=domain_name)
             return config
             
         except Exception as e:
             logger.error("Failed to get mode config", domain=domain_name, error=str(e))
             raise
     
+    async def _fetch_mode_config_row(self, domain_name: Optional[str]) -> Dict[str, Any]:
+        query = self.client.table('analysis_mode_config').select(self._MODE_CONFIG_SELECT)
+        
+        if domain_name:
+            query = query.eq('domain_name', domain_name)
+        else:
+            query = query.is_('domain_name', 'null')
+        
+        result = await self._execute(query.limit(1), 'short')
+        return result.data[0] if result.data else {}
+    
     async def save_mode_config(self, config: AnalysisModeConfig) -> str:
         """Save analysis mode configuration"""
         try:
-            result = self.client.table('analysis_mode_config').upsert({
+            result = await self._execute(self.client.table('analysis_mode_config').upsert({
                 'domain_name': config.domain_name,
                 'mode_preference': config.mode_preference.value,
                 'async_enabled': config.async_enabled,
                 'cache_ttl_hours': config.cache_ttl_hours,
                 'manual_refresh_enabled': config.manual_refresh_enabled,
                 'progress_indicators_enabled': config.progress_indicators_enabled
-            }, on_conflict='domain_name').execute()
+            }, on_conflict='domain_name').select('id'), 'medium')
+            self._mode_cache.pop(('mode', config.domain_name or None))
             
             config_id = result.data[0]['id'] if result.data else None
             logger.info("Mode config saved successfully", domain=config.domain_name, config_id=config_id)
@@ -564,35 +943,33 @@ class DatabaseService:
                 logger.error("Supabase client not available", domain=domain_name)
                 raise Exception("Supabase client not available")
             
-            # Delete detailed analysis data
+            # The dependent tables are independent of each other, so delete from
+            # them concurrently; any failure aborts before the report is touched
+            normalized_domain = self._normalize_domain(domain_name)
+            dependent_deletes = {
+                'detailed_analysis_data': self.client.table('detailed_analysis_data').delete(count=CountMethod.exact, returning=ReturnMethod.minimal).eq('domain_name', domain_name),
+                'raw_data_cache': self.client.table('raw_data_cache').delete(count=CountMethod.exact, returning=ReturnMethod.minimal).eq('domain_name', normalized_domain),
+                'async_tasks': self.client.table('async_tasks').delete(count=CountMethod.exact, returning=ReturnMethod.minimal).eq('domain_name', domain_name),
+                'analysis_mode_config': self.client.table('analysis_mode_config').delete(count=CountMethod.exact, returning=ReturnMethod.minimal).eq('domain_name', domain_name),
+            }
             try:
-                logger.info("Attempting to delete detailed analysis data", domain=domain_name)
-                detailed_data_result = self.client.table('detailed_analysis_data').delete().eq('domain_name', domain_name).execute()
-                deleted_count += len(detailed_data_result.data) if detailed_data_result.data else 0
-                logger.info("Deleted detailed analysis data", domain=domain_name, count=len(detailed_data_result.data) if detailed_data_result.data else 0, result_data=detailed_data_result.data)
-            except Exception as e:
-                logger.error("Failed to delete detailed analysis data", domain=domain_name, error=str(e))
-                raise
-            
-            # Delete raw data cache
-            cache_result = self.client.table('raw_data_cache').delete().eq('domain_name', domain_name).execute()
-            deleted_count += len(cache_result.data) if cache_result.data else 0
-            logger.info("Deleted raw data cache", domain=domain_name, count=len(cache_result.data) if cache_result.data else 0)
-            
-            # Delete async tasks
-            tasks_result = self.client.table('async_tasks').delete().eq('domain_name', domain_name).execute()
-            deleted_count += len(tasks_result.data) if tasks_result.data else 0
-            logger.info("Deleted async tasks", domain=domain_name, count=len(tasks_result.data) if tasks_result.data else 0)
-            
-            # Delete mode configuration
-            config_result = self.client.table('analysis_mode_config').delete().eq('domain_name', domain_name).execute()
-            deleted_count += len(config_result.data) if config_result.data else 0
-            logger.info("Deleted mode configuration", domain=domain_name, count=len(config_result.data) if config_result.data else 0)
+                results = await asyncio.gather(*(self._execute(query, 'long') for query in dependent_deletes.values()))
+            finally:
+                self._invalidate_raw_cache(normalized_domain)
+                self._mode_cache.pop(('mode', domain_name or None))
+            for table, table_result in zip(dependent_deletes, results):
+                count = table_result.count or 0
+                deleted_count += count
+                logger.info("Deleted related records", domain=domain_name, table=table, count=count)
             
             # Delete main report (this should be last to maintain referential integrity)
-            report_result = self.client.table('reports').delete().eq('domain_name', domain_name).execute()
-            deleted_count += len(report_result.data) if report_result.data else 0
-            logger.info("Deleted main report", domain=domain_name, count=len(report_result.data) if report_result.data else 0)
+            report_result = await self._execute(
+                self.client.table('reports').delete(count=CountMethod.exact, returning=ReturnMethod.minimal).eq('domain_name', normalized_domain),
+                'long'
+            )
+            self._report_cache.pop(normalized_domain)
+            deleted_count += report_result.count or 0
+            logger.info("Deleted main report", domain=domain_name, count=report_result.count or 0)
             
             logger.info("Domain analysis deletion completed", domain=domain_name, total_deleted=deleted_count)
             return deleted_count > 0
@@ -615,50 +992,45 @@ class DatabaseService:
             
             result = BulkDomainSyncResult(total_count=len(domains))
             
+            # One provider per domain (the last one given wins), since a single
+            # INSERT ... ON CONFLICT cannot touch the same row twice
+            providers = {}
             for domain_input in domains:
-                try:
-                    # Check if domain exists
-                    existing = self.client.table('bulk_domain_analysis').select('*').eq('domain_name', domain_input.domain).execute()
-                    
-                    if existing.data and len(existing.data) > 0:
-                        # Domain exists - update only if needed
-                        existing_record = existing.data[0]
-                        existing_summary = existing_record.get('backlinks_bulk_page_summary')
-                        
-                        # Only update provider, preserve summary data
-                        update_data = {
-                            'updated_at': datetime.utcnow().isoformat()
-                        }
-                        
-                        # Update provider if it's different
-                        if domain_input.provider and existing_record.get('provider') != domain_input.provider:
-                            update_data['provider'] = domain_input.provider
-                        
-                        # Only update if there's something to update
-                        if len(update_data) > 1:  # More than just updated_at
-                            self.client.table('bulk_domain_analysis').update(update_data).eq('domain_name', domain_input.domain).execute()
-                            result.updated_count += 1
-                            result.updated_domains.append(domain_input.domain)
-                            logger.info("Updated bulk domain", domain=domain_input.domain, has_summary=existing_summary is not None)
-                        else:
-                            result.skipped_count += 1
-                            result.skipped_domains.append(domain_input.domain)
-                    else:
-                        # Domain doesn't exist - create new record
-                        new_record = {
-                            'domain_name': domain_input.domain,
-                            'provider': domain_input.provider,
-                            'backlinks_bulk_page_summary': None
-                        }
-                        self.client.table('bulk_domain_analysis').insert(new_record).execute()
-                        result.created_count += 1
-                        result.created_domains.append(domain_input.domain)
-                        logger.info("Created bulk domain", domain=domain_input.domain)
-                        
-                except Exception as e:
-                    logger.error("Failed to sync domain", domain=domain_input.domain, error=str(e))
-                    result.skipped_count += 1
-                    result.skipped_domains.append(domain_input.domain)
+                if domain_input.provider or domain_input.domain not in providers:
+                    providers[domain_input.domain] = domain_input.provider
+            
+            # sync_bulk_domains inserts missing domains and updates changed
+            # providers in one atomic statement, leaving summaries untouched
+            rpc_result = await self._execute(
+                self.client.rpc('sync_bulk_domains', {
+                    'p_domains': [{'domain_name': domain, 'provider': provider} for domain, provider in providers.items()]
+                }),
+                'long'
+            )
+            # One JSONB object rather than a row per domain, so PostgREST's
+            # max-rows cap cannot truncate large syncs
+            written = rpc_result.data or {}
+            inserted = set(written.get('inserted') or [])
+            updated = set(written.get('updated') or [])
+            for domain in inserted | updated:
+                self._bulk_domain_cache.pop(('bulk', domain))
+            
+            seen = set()
+            for domain_input in domains:
+                domain = domain_input.domain
+                # Repeated entries for the same domain count as skipped
+                if domain in seen:
+                    result.skipped_domains.append(domain)
+                elif domain in inserted:
+                    result.created_domains.append(domain)
+                elif domain in updated:
+                    result.updated_domains.append(domain)
+                else:
+                    result.skipped_domains.append(domain)
+                seen.add(domain)
+            result.created_count = len(result.created_domains)
+            result.updated_count = len(result.updated_domains)
+            result.skipped_count = len(result.skipped_domains)
             
             logger.info("Bulk domain sync completed", 
                        created=result.created_count, 
@@ -670,15 +1042,31 @@ class DatabaseService:
             logger.error("Failed to sync bulk domains", error=str(e))
             raise
     
-    async def get_bulk_domains_missing_summary(self) -> List[str]:
+    async def get_bulk_domains_missing_summary(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
         """
         Get list of domain names that are missing backlinks_bulk_page_summary data
+        
+        Args:
+            limit: Maximum number of domains to return. PostgREST's max-rows
+                still caps a single call, so page with ``after`` to read them all
+            after: Only return domains sorting after this one, for keyset paging
+            
+        Returns:
+            Domain names in ascending order
         """
         try:
             if not self.client:
                 raise Exception("Supabase client not available")
             
-            result = self.client.table('bulk_domain_analysis').select('domain_name').is_('backlinks_bulk_page_summary', 'null').execute()
+            # Served by the partial index idx_bulk_domain_analysis_summary_null
+            query = self.client.table('bulk_domain_analysis').select('domain_name').is_('backlinks_bulk_page_summary', 'null')
+            if after:
+                query = query.gt('domain_name', after)
+            query = query.order('domain_name')
+            if limit:
+                query = query.limit(limit)
+            
+            result = await self._execute(query, 'medium')
             
             domains = [row['domain_name'] for row in result.data] if result.data else []
             logger.info("Found domains missing summary", count=len(domains))
@@ -711,28 +1099,11 @@ class DatabaseService:
             
             for i in range(0, len(domain_names), batch_size):
                 batch = domain_names[i:i + batch_size]
-                result = self.client.table('bulk_domain_analysis').select('*').in_('domain_name', batch).execute()
+                result = await self._execute(self.client.table('bulk_domain_analysis').select(self._BULK_DOMAIN_SELECT).in_('domain_name', batch), 'medium')
                 
                 if result.data:
                     for row in result.data:
-                        # Parse backlinks_bulk_page_summary if present
-                        summary = None
-                        if row.get('backlinks_bulk_page_summary'):
-                            try:
-                                from models.domain_analysis import BulkPageSummaryResult
-                                summary = BulkPageSummaryResult(**row['backlinks_bulk_page_summary'])
-                            except Exception as e:
-                                logger.warning("Failed to parse summary", domain=row.get('domain_name'), error=str(e))
-                        
-                        record = BulkDomainAnalysis(
-                            id=row.get('id'),
-                            domain_name=row['domain_name'],
-                            provider=row.get('provider'),
-                            backlinks_bulk_page_summary=summary,
-                            created_at=parse_iso_datetime(row.get('created_at')),
-                            updated_at=parse_iso_datetime(row.get('updated_at'))
-                        )
-                        all_records.append(record)
+                        all_records.append(self._row_to_bulk_domain(row))
             
             logger.info("Retrieved bulk domains by names", requested=len(domain_names), found=len(all_records))
             return all_records
@@ -750,10 +1121,11 @@ class DatabaseService:
             if not self.client:
                 raise Exception("Supabase client not available")
             
-            result = self.client.table('bulk_domain_analysis').update({
+            result = await self._execute(self.client.table('bulk_domain_analysis').update({
                 'backlinks_bulk_page_summary': summary_data,
-                'updated_at': datetime.utcnow().isoformat()
-            }).eq('domain_name', domain).execute()
+                'updated_at': datetime.now(timezone.utc).isoformat()
+            }).eq('domain_name', domain), 'medium')
+            self._bulk_domain_cache.pop(('bulk', domain))
             
             record_id = result.data[0]['id'] if result.data else None
             logger.info("Saved bulk page summary", domain=domain, record_id=record_id)
@@ -763,9 +1135,14 @@ class DatabaseService:
             logger.error("Failed to save bulk page summary", domain=domain, error=str(e))
             raise
     
-    async def get_all_bulk_domains(self, sort_by: str = 'created_at', order: str = 'desc') -> List[BulkDomainAnalysis]:
+    async def iter_bulk_domains(
+        self, sort_by: str = 'created_at', order: str = 'desc', page_size: int = 500
+    ) -> AsyncIterator[BulkDomainAnalysis]:
         """
-        Get all bulk domain analysis records with sorting
+        Yield bulk domain analysis records with sorting, one page at a time
+        
+        Pages are fetched as the caller consumes them, so stopping early skips
+        the remaining queries and at most one page of rows is held at once.
         """
         try:
             if not self.client:
@@ -780,37 +1157,32 @@ class DatabaseService:
             if order not in ['asc', 'desc']:
                 order = 'desc'
             
-            query = self.client.table('bulk_domain_analysis').select('*')
-            
-            # Apply sorting
-            if order == 'desc':
-                query = query.order(sort_by, desc=True)
-            else:
-                query = query.order(sort_by, desc=False)
-            
-            result = query.execute()
+            offset = 0
+            while True:
+                # id breaks sort ties so rows do not shift between pages
+                query = self.client.table('bulk_domain_analysis').select(self._BULK_DOMAIN_SELECT)\
+                    .order(sort_by, desc=(order == 'desc')).order('id')\
+                    .range(offset, offset + page_size - 1)
+                result = await self._execute(query, 'medium')
+                rows = result.data or []
+                
+                for row in rows:
+                    yield self._row_to_bulk_domain(row)
+                
+                if len(rows) < page_size:
+                    break
+                offset += page_size
             
-            records = []
-            if result.data:
-                for row in result.data:
-                    # Parse backlinks_bulk_page_summary if present
-                    summary = None
-                    if row.get('backlinks_bulk_page_summary'):
-                        try:
-                            from models.domain_analysis import BulkPageSummaryResult
-                            summary = BulkPageSummaryResult(**row['backlinks_bulk_page_summary'])
-                        except Exception as e:
-                            logger.warning("Failed to parse summary data", domain=row.get('domain_name'), error=str(e))
-                    
-                    record = BulkDomainAnalysis(
-                        id=row['id'],
-                        domain_name=row['domain_name'],
-                        provider=row.get('provider'),
-                        backlinks_bulk_page_summary=summary,
-                        created_at=parse_iso_datetime(row.get('created_at')),
-                        updated_at=parse_iso_datetime(row.get('updated_at'))
-                    )
-                    records.append(record)
+        except Exception as e:
+            logger.error("Failed to iterate bulk domains", error=str(e))
+            raise
+    
+    async def get_all_bulk_domains(self, sort_by: str = 'created_at', order: str = 'desc') -> List[BulkDomainAnalysis]:
+        """
+        Get all bulk domain analysis records with sorting
+        """
+        try:
+            records = [record async for record in self.iter_bulk_domains(sort_by, order)]
             
             logger.info("Retrieved bulk domains", count=len(records), sort_by=sort_by, order=order)
             return records
@@ -829,24 +1201,30 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             logger.info("Starting table truncate")
-            # Use a more efficient delete - delete all records
-            # Supabase doesn't have TRUNCATE in the client, so we delete all
-            result = self.client.table('namecheap_domains').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
-            logger.info("Table truncate complete", deleted_count=len(result.data) if result.data else 0)
+            # TRUNCATE through the truncate_namecheap_domains_table function,
+            # since the client cannot issue it directly
+            await self._execute(self.client.rpc('truncate_namecheap_domains_table', {}), 'long')
+            self._namecheap_cache.clear()
+            logger.info("Table truncate complete")
             return True
             
         except Exception as e:
             logger.error("Failed to truncate namecheap_domains", error=str(e))
-            # If delete fails, try alternative approach
+            # If the function is unavailable, delete the rows in id batches
             try:
                 logger.info("Trying alternative truncate method")
-                # Get all IDs and delete them
-                all_records = self.client.table('namecheap_domains').select('id').execute()
-                if all_records.data:
-                    ids = [r['id'] for r in all_records.data]
-                    for id in ids:
-                        self.client.table('namecheap_domains').delete().eq('id', id).execute()
-                logger.info("Alternative truncate complete")
+                # ~200 UUIDs keep the in.(...) filter well inside URL length limits
+                batch_size = 200
+                deleted_count = 0
+                while True:
+                    batch = await self._execute(self.client.table('namecheap_domains').select('id').limit(batch_size), 'medium')
+                    ids = [r['id'] for r in batch.data or []]
+                    if not ids:
+                        break
+                    await self._execute(self.client.table('namecheap_domains').delete(returning=ReturnMethod.minimal).in_('id', ids), 'long')
+                    deleted_count += len(ids)
+                self._namecheap_cache.clear()
+                logger.info("Alternative truncate complete", deleted_count=deleted_count)
                 return True
             except Exception as e2:
                 logger.error("Alternative truncate also failed", error=str(e2))
@@ -866,15 +1244,15 @@ class DatabaseService:
             
             # Prepare all domain data for batch insert
             batch_size = 500  # Reduced batch size to avoid timeouts
-            inserted_count = 0
-            skipped_count = 0
             total_batches = (len(domains) + batch_size - 1) // batch_size
             
             logger.info("Starting bulk insert", total_domains=len(domains), batch_size=batch_size, total_batches=total_batches)
             
-            # Process in batches
-            for batch_num, i in enumerate(range(0, len(domains), batch_size), 1):
-                batch = domains[i:i + batch_size]
+            # Batches are independent, so they are inserted concurrently; each
+            # one is a single POST, so overlapping them hides the round trips
+            batch_slots = asyncio.Semaphore(self._NAMECHEAP_INSERT_CONCURRENCY)
+            
+            async def insert_batch(batch_num: int, batch: List[NamecheapDomain]) -> Dict[str, int]:
                 batch_data = []
                 
                 logger.info("Preparing batch", batch_num=batch_num, total_batches=total_batches, batch_size=len(batch))
@@ -909,34 +1287,27 @@ class DatabaseService:
                     }
                     batch_data.append(domain_data)
                 
-                try:
-                    # Batch insert
+                async with batch_slots:
                     logger.info("Inserting batch", batch_num=batch_num, records=len(batch_data))
-                    result = self.client.table('namecheap_domains').insert(batch_data).execute()
-                    inserted_count += len(batch_data)
-                    logger.info("Batch inserted successfully", batch_num=batch_num, inserted=len(batch_data), total_inserted=inserted_count)
-                    
-                except Exception as e:
-                    # If batch insert fails (e.g., due to duplicates), fall back to individual inserts
-                    logger.warning("Batch insert failed, falling back to individual inserts", 
-                                 batch_num=batch_num, error=str(e), batch_start=i)
-                    for idx, domain_data in enumerate(batch_data):
-                        try:
-                            self.client.table('namecheap_domains').insert(domain_data).execute()
-                            inserted_count += 1
-                            if (idx + 1) % 100 == 0:
-                                logger.info("Individual insert progress", batch_num=batch_num, processed=idx+1, total=len(batch_data))
-                        except Exception as e2:
-                            if 'duplicate' in str(e2).lower() or 'unique' in str(e2).lower():
-                                skipped_count += 1
-                            else:
-                                logger.warning("Failed to insert domain", domain=domain_data.get('name'), error=str(e2))
-                                skipped_count += 1
-            
-            logger.info("Bulk insert complete", inserted=inserted_count, skipped=skipped_count, total=len(domains))
+                    counts = await self._insert_namecheap_rows(batch_data)
+                counts["skipped"] = len(batch_data) - counts["inserted"] - counts["failed"]
+                logger.info("Batch inserted", batch_num=batch_num, **counts)
+                return counts
+            
+            batch_results = await asyncio.gather(*(
+                insert_batch(batch_num, domains[i:i + batch_size])
+                for batch_num, i in enumerate(range(0, len(domains), batch_size), 1)
+            ))
+            inserted_count = sum(r["inserted"] for r in batch_results)
+            skipped_count = sum(r["skipped"] for r in batch_results)
+            failed_count = sum(r["failed"] for r in batch_results)
+            
+            logger.info("Bulk insert complete", inserted=inserted_count, skipped=skipped_count,
+                        failed=failed_count, total=len(domains))
             return {
                 "inserted": inserted_count,
                 "skipped": skipped_count,
+                "failed": failed_count,
                 "total": len(domains)
             }
             
@@ -944,6 +1315,49 @@ class DatabaseService:
             logger.error("Failed to load namecheap domains", error=str(e), exc_info=True)
             raise
     
+    async def _insert_namecheap_rows(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert rows into namecheap_domains, returning inserted and failed counts.
+        
+        Rows whose name already exists are skipped by ON CONFLICT DO NOTHING
+        in the same statement; only new ids come back, so rows neither inserted
+        nor failed are duplicates. A batch rejected for a row-level reason
+        (a duplicate url, a bad value) is split in half and each half retried,
+        isolating the offending rows in O(log n) extra requests. Other failures
+        (timeouts, 5xx, dropped connections) are retried with exponential
+        backoff; a timed-out insert may have committed, which is safe to retry
+        because existing names are skipped. Rows still failing are counted as
+        failed, never as skipped.
+        """
+        for attempt in range(1, self._NAMECHEAP_INSERT_ATTEMPTS + 1):
+            try:
+                result = await self._execute(
+                    self.client.table('namecheap_domains').upsert(rows, on_conflict='name', ignore_duplicates=True).select('id'),
+                    'long'
+                )
+                return {"inserted": len(result.data or []), "failed": 0}
+            except Exception as e:
+                # SQLSTATE classes 22 (data exception) and 23 (integrity constraint violation)
+                row_level = isinstance(e, APIError) and str(e.code or '').startswith(('22', '23'))
+                if row_level:
+                    if len(rows) > 1:
+                        mid = len(rows) // 2
+                        first = await self._insert_namecheap_rows(rows[:mid])
+                        second = await self._insert_namecheap_rows(rows[mid:])
+                        return {key: first[key] + second[key] for key in first}
+                    if e.code == '23505':
+                        return {"inserted": 0, "failed": 0}
+                    logger.warning("Failed to insert domain", domain=rows[0].get('name'), error=str(e))
+                    return {"inserted": 0, "failed": 1}
+                
+                if attempt == self._NAMECHEAP_INSERT_ATTEMPTS:
+                    logger.error("Failed to insert domains after retries", count=len(rows),
+                                 domain=rows[0].get('name'), attempts=attempt, error=str(e))
+                    return {"inserted": 0, "failed": len(rows)}
+                delay = self._NAMECHEAP_RETRY_DELAY_SECONDS * 2 ** (attempt - 1)
+                logger.warning("Insert failed, retrying", count=len(rows), attempt=attempt, delay=delay, error=str(e))
+                await asyncio.sleep(delay)
+    
     async def get_all_namecheap_domains(
         self, 
         sort_by: str = 'name', 
@@ -976,27 +1390,24 @@ class DatabaseService:
             if order not in ['asc', 'desc']:
                 order = 'asc'
             
-            query = self.client.table('namecheap_domains').select('*')
+            query = self.client.table('namecheap_domains').select(self._NAMECHEAP_SELECT)
             
             # Apply search filter
             if search:
                 query = query.ilike('name', f'%{search}%')
             
-            # Apply extension filter at database level using SQL pattern matching
+            # Apply extension filter at database level using SQL pattern matching:
+            # name LIKE '%.com' OR name LIKE '%.net' etc. (* is PostgREST's LIKE wildcard)
             if extensions:
-                # Build OR conditions for each extension
-                # Use SQL LIKE pattern: name LIKE '%.com' OR name LIKE '%.net' etc.
-                extension_filters = []
-                for ext in extensions:
-                    # Remove leading dot if present for pattern matching
-                    ext_clean = ext.lstrip('.')
-                    extension_filters.append(f"name.like.%.{ext_clean}")
-                
-                # Apply first extension filter, then chain OR conditions
-                if extension_filters:
-                    # Supabase doesn't support OR directly in Python client easily
-                    # So we'll filter in Python but fetch a reasonable limit first
-                    pass  # Will filter in Python after fetch
+                query = query.or_(','.join(f"name.like.*.{ext.lstrip('.')}" for ext in extensions))
+            
+            # Apply no special characters filter (anything but alphanumerics, dots and hyphens)
+            if no_special_chars:
+                query = query.filter('name', 'not.match', '[^a-zA-Z0-9.-]')
+            
+            # Apply no numbers filter
+            if no_numbers:
+                query = query.filter('name', 'not.match', '[0-9]')
             
             # Apply sorting
             if order == 'desc':
@@ -1004,83 +1415,17 @@ class DatabaseService:
             else:
                 query = query.order(sort_by, desc=False)
             
-            # Apply pagination FIRST to limit what we fetch from database
-            # For filtered queries, fetch more records since filtering happens in Python
+            # Filters run in the database, so offset/limit paginate the filtered rows
             # Cap fetch size to prevent database timeouts
             MAX_FETCH = 1000  # Maximum records to fetch in one query
+            query = query.range(offset, offset + min(limit, MAX_FETCH) - 1)
             
-            if extensions or no_special_chars or no_numbers:
-                # When filtering, fetch more to get enough results after filtering
-                fetch_limit = min(limit * 3, MAX_FETCH)
-            else:
-                fetch_limit = min(limit, MAX_FETCH)
-            
-            query = query.range(offset, offset + fetch_limit - 1)
-            
-            result = query.execute()
+            result = await self._execute(query, 'medium')
             
             records = []
             if result.data:
                 for row in result.data:
-                    domain_name = row.get('name', '')
-                    
-                    # Apply extension filter
-                    if extensions:
-                        # Extract extension (e.g., 'example.com' -> '.com')
-                        if '.' in domain_name:
-                            domain_ext = '.' + domain_name.split('.')[-1]
-                            if domain_ext not in extensions:
-                                continue
-                        else:
-                            # No extension found, skip if extensions filter is set
-                            continue
-                    
-                    # Apply no special characters filter
-                    if no_special_chars:
-                        # Check if domain has special characters (excluding dots and hyphens which are valid)
-                        # Special chars: anything that's not alphanumeric, dot, or hyphen
-                        if re.search(r'[^a-zA-Z0-9.\-]', domain_name):
-                            continue
-                    
-                    # Apply no numbers filter
-                    if no_numbers:
-                        # Check if domain has any digits
-                        if re.search(r'\d', domain_name):
-                            continue
-                    
-                    # Stop if we've collected enough records after filtering
-                    if len(records) >= limit:
-                        break
-                    domain = NamecheapDomain(
-                        id=row['id'],
-                        url=row.get('url'),
-                        name=row['name'],
-                        start_date=datetime.fromisoformat(row['start_date'].replace('Z', '+00:00')) if row.get('start_date') else None,
-                        end_date=datetime.fromisoformat(row['end_date'].replace('Z', '+00:00')) if row.get('end_date') else None,
-                        price=float(row['price']) if row.get('price') is not None else None,
-                        start_price=float(row['start_price']) if row.get('start_price') is not None else None,
-                        renew_price=float(row['renew_price']) if row.get('renew_price') is not None else None,
-                        bid_count=row.get('bid_count'),
-                        ahrefs_domain_rating=float(row['ahrefs_domain_rating']) if row.get('ahrefs_domain_rating') is not None else None,
-                        umbrella_ranking=row.get('umbrella_ranking'),
-                        cloudflare_ranking=row.get('cloudflare_ranking'),
-                        estibot_value=float(row['estibot_value']) if row.get('estibot_value') is not None else None,
-                        extensions_taken=row.get('extensions_taken'),
-                        keyword_search_count=row.get('keyword_search_count'),
-                        registered_date=datetime.fromisoformat(row['registered_date'].replace('Z', '+00:00')) if row.get('registered_date') else None,
-                        last_sold_price=float(row['last_sold_price']) if row.get('last_sold_price') is not None else None,
-                        last_sold_year=row.get('last_sold_year'),
-                        is_partner_sale=row.get('is_partner_sale'),
-                        semrush_a_score=row.get('semrush_a_score'),
-                        majestic_citation=row.get('majestic_citation'),
-                        ahrefs_backlinks=row.get('ahrefs_backlinks'),
-                        semrush_backlinks=row.get('semrush_backlinks'),
-                        majestic_backlinks=row.get('majestic_backlinks'),
-                        majestic_trust_flow=float(row['majestic_trust_flow']) if row.get('majestic_trust_flow') is not None else None,
-                        go_value=float(row['go_value']) if row.get('go_value') is not None else None,
-                        created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')) if row.get('created_at') else None,
-                        updated_at=datetime.fromisoformat(row['updated_at'].replace('Z', '+00:00')) if row.get('updated_at') else None
-                    )
+                    domain = NamecheapDomain.model_validate(row)
                     records.append(domain)
             
             logger.info("Retrieved namecheap domains", count=len(records), sort_by=sort_by, order=order, search=search)
@@ -1098,42 +1443,13 @@ class DatabaseService:
             if not self.client:
                 raise Exception("Supabase client not available")
             
-            result = self.client.table('namecheap_domains').select('*').eq('name', domain_name).execute()
-            
-            if not result.data or len(result.data) == 0:
+            row = await self._cached_read(
+                self._namecheap_cache, ('namecheap', domain_name), lambda: self._fetch_namecheap_row(domain_name)
+            )
+            if row is None:
                 return None
             
-            row = result.data[0]
-            domain = NamecheapDomain(
-                id=row['id'],
-                url=row.get('url'),
-                name=row['name'],
-                start_date=datetime.fromisoformat(row['start_date'].replace('Z', '+00:00')) if row.get('start_date') else None,
-                end_date=datetime.fromisoformat(row['end_date'].replace('Z', '+00:00')) if row.get('end_date') else None,
-                price=float(row['price']) if row.get('price') is not None else None,
-                start_price=float(row['start_price']) if row.get('start_price') is not None else None,
-                renew_price=float(row['renew_price']) if row.get('renew_price') is not None else None,
-                bid_count=row.get('bid_count'),
-                ahrefs_domain_rating=float(row['ahrefs_domain_rating']) if row.get('ahrefs_domain_rating') is not None else None,
-                umbrella_ranking=row.get('umbrella_ranking'),
-                cloudflare_ranking=row.get('cloudflare_ranking'),
-                estibot_value=float(row['estibot_value']) if row.get('estibot_value') is not None else None,
-                extensions_taken=row.get('extensions_taken'),
-                keyword_search_count=row.get('keyword_search_count'),
-                registered_date=datetime.fromisoformat(row['registered_date'].replace('Z', '+00:00')) if row.get('registered_date') else None,
-                last_sold_price=float(row['last_sold_price']) if row.get('last_sold_price') is not None else None,
-                last_sold_year=row.get('last_sold_year'),
-                is_partner_sale=row.get('is_partner_sale'),
-                semrush_a_score=row.get('semrush_a_score'),
-                majestic_citation=row.get('majestic_citation'),
-                ahrefs_backlinks=row.get('ahrefs_backlinks'),
-                semrush_backlinks=row.get('semrush_backlinks'),
-                majestic_backlinks=row.get('majestic_backlinks'),
-                majestic_trust_flow=float(row['majestic_trust_flow']) if row.get('majestic_trust_flow') is not None else None,
-                go_value=float(row['go_value']) if row.get('go_value') is not None else None,
-                created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')) if row.get('created_at') else None,
-                updated_at=datetime.fromisoformat(row['updated_at'].replace('Z', '+00:00')) if row.get('updated_at') else None
-            )
+            domain = NamecheapDomain.model_validate(row)
             
             return domain
             
@@ -1141,6 +1457,12 @@ class DatabaseService:
             logger.error("Failed to get namecheap domain by name", domain=domain_name, error=str(e))
             raise
     
+    async def _fetch_namecheap_row(self, domain_name: str) -> Optional[Dict[str, Any]]:
+        result = await self._execute(
+            self.client.table('namecheap_domains').select(self._NAMECHEAP_SELECT).eq('name', domain_name).limit(1), 'short'
+        )
+        return result.data[0] if result.data else None
+    
     async def get_bulk_domain(self, domain_name: str) -> Optional[BulkDomainAnalysis]:
         """
         Get bulk domain analysis record by domain name
@@ -1149,37 +1471,24 @@ class DatabaseService:
             if not self.client:
                 raise Exception("Supabase client not available")
             
-            result = self.client.table('bulk_domain_analysis').select('*').eq('domain_name', domain_name).execute()
-            
-            if not result.data or len(result.data) == 0:
-                return None
-            
-            row = result.data[0]
-            
-            # Parse backlinks_bulk_page_summary if present
-            summary = None
-            if row.get('backlinks_bulk_page_summary'):
-                try:
-                    from models.domain_analysis import BulkPageSummaryResult
-                    summary = BulkPageSummaryResult(**row['backlinks_bulk_page_summary'])
-                except Exception as e:
-                    logger.warning("Failed to parse summary data", domain=domain_name, error=str(e))
-            
-            record = BulkDomainAnalysis(
-                id=row['id'],
-                domain_name=row['domain_name'],
-                provider=row.get('provider'),
-                backlinks_bulk_page_summary=summary,
-                created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')) if row.get('created_at') else None,
-                updated_at=datetime.fromisoformat(row['updated_at'].replace('Z', '+00:00')) if row.get('updated_at') else None
+            row = await self._cached_read(
+                self._bulk_domain_cache, ('bulk', domain_name), lambda: self._fetch_bulk_domain_row(domain_name)
             )
+            if row is None:
+                return None
             
-            return record
+            return self._row_to_bulk_domain(row)
             
         except Exception as e:
             logger.error("Failed to get bulk domain", domain=domain_name, error=str(e))
             raise
     
+    async def _fetch_bulk_domain_row(self, domain_name: str) -> Optional[Dict[str, Any]]:
+        result = await self._execute(
+            self.client.table('bulk_domain_analysis').select(self._BULK_DOMAIN_SELECT).eq('domain_name', domain_name).limit(1), 'short'
+        )
+        return result.data[0] if result.data else None
+    
     # Auctions Methods
     async def truncate_auctions(self) -> bool:
         """Truncate auctions table - skip if empty, otherwise use efficient deletion"""
@@ -1188,7 +1497,7 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             # First, check if table is empty or small
-            count_result = self.client.table('auctions').select('id', count='exact').limit(1).execute()
+            count_result = await self._execute(self.client.table('auctions').select('id', count='exact').limit(1), 'long')
             total_count = count_result.count if hasattr(count_result, 'count') else None
             
             if total_count is not None and total_count == 0:
@@ -1214,7 +1523,7 @@ class DatabaseService:
                             await asyncio.sleep(5)  # Give N8N time to execute SQL
                             # Verify truncation completed
                             for attempt in range(3):  # Check up to 3 times
-                                verify_result = self.client.table('auctions').select('id', count='exact').limit(1).execute()
+                                verify_result = await self._execute(self.client.table('auctions').select('id', count='exact').limit(1), 'long')
                                 if verify_result.count == 0:
                                     logger.info("Auctions table truncated successfully via N8N")
                                     return True
@@ -1240,7 +1549,7 @@ class DatabaseService:
             # For smaller tables, use simple DELETE
             try:
                 # Delete all records using a simple filter
-                self.client.table('auctions').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
+                await self._execute(self.client.table('auctions').delete(returning=ReturnMethod.minimal).neq('id', '00000000-0000-0000-0000-000000000000'), 'long')
                 logger.info("Auctions table truncated using DELETE")
                 return True
             except Exception as delete_error:
@@ -1291,10 +1600,11 @@ class DatabaseService:
                     # The unique constraint is on (domain, auction_site, expiration_date)
                     # Note: backlinks_bulk_page_summary is in bulk_domain_analysis table, not auctions
                     # So it's automatically preserved when we update auctions
-                    result = self.client.table('auctions').upsert(
+                    await self._execute(self.client.table('auctions').upsert(
                         batch,
-                        on_conflict='domain,auction_site,expiration_date'
-                    ).execute()
+                        on_conflict='domain,auction_site,expiration_date',
+                        returning=ReturnMethod.minimal
+                    ), 'long')
                     
                     # Approximate: assume all are inserts (upsert will update if exists)
                     # For accurate counts, we'd need to check each record first, which is expensive
@@ -1311,10 +1621,11 @@ class DatabaseService:
                     logger.warning("Batch upsert failed, using individual upserts", batch_num=batch_num, error=str(e))
                     for auction_data in batch:
                         try:
-                            self.client.table('auctions').upsert(
+                            await self._execute(self.client.table('auctions').upsert(
                                 auction_data,
-                                on_conflict='domain,auction_site,expiration_date'
-                            ).execute()
+                                on_conflict='domain,auction_site,expiration_date',
+                                returning=ReturnMethod.minimal
+                            ), 'medium')
                             inserted_count += 1
                         except Exception as e2:
                             if 'duplicate' in str(e2).lower() or 'unique' in str(e2).lower():
@@ -1352,7 +1663,7 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             # Call the optimized RPC function which deletes in chunks (limit 10k)
-            result = self.client.rpc('delete_expired_auctions', {}).execute()
+            result = await self._execute(self.client.rpc('delete_expired_auctions', {}), 'long')
             
             # Verify result format (RPC returns integer directly or in data)
             deleted_count = result.data if result.data is not None else 0
@@ -1386,13 +1697,12 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             result = (
-                self.client.table('auctions')
+                await self._execute(self.client.table('auctions')
                 .select('*')
                 .eq('preferred', True)
                 .eq('has_statistics', False)
                 .order('expiration_date', desc=False)
-                .limit(limit)
-                .execute()
+                .limit(limit), 'medium')
             )
             
             auctions = result.data if result.data else []
@@ -1428,10 +1738,10 @@ class DatabaseService:
                 
                 for domain_name in batch:
                     try:
-                        self.client.table('auctions').update({
+                        await self._execute(self.client.table('auctions').update({
                             'has_statistics': True,
-                            'updated_at': datetime.utcnow().isoformat()
-                        }).eq('domain', domain_name).execute()
+                            'updated_at': datetime.now(timezone.utc).isoformat()
+                        }).eq('domain', domain_name), 'medium')
                         updated_count += 1
                     except Exception as e:
                         logger.warning("Failed to mark has_statistics", domain=domain_name, error=str(e))
@@ -1559,7 +1869,7 @@ class DatabaseService:
             # Note: We'll estimate total count by getting a sample and extrapolating
             # For exact count, we'd need a separate count query, but Supabase client doesn't support it directly
             # So we'll get the paginated results and use a reasonable estimate
-            result = query.range(offset, offset + limit - 1).execute()
+            result = await self._execute(query.range(offset, offset + limit - 1), 'long')
             auctions = result.data if result.data else []
             
             # Fetch domains from result
@@ -1569,7 +1879,7 @@ class DatabaseService:
             has_analysis_domains = set()
             if domains:
                 # Use in_ filter to find reports for these domains
-                reports_result = self.client.table('reports').select('domain_name').in_('domain_name', domains).execute()
+                reports_result = await self._execute(self.client.table('reports').select('domain_name').in_('domain_name', domains), 'medium')
                 if reports_result.data:
                     has_analysis_domains = {r['domain_name'] for r in reports_result.data}
             
@@ -1683,7 +1993,7 @@ class DatabaseService:
 
             # Fetch a larger candidate pool so we have enough after in-memory filtering
             fetch_limit = min(limit * 4, 5000)
-            result = query.limit(fetch_limit).execute()
+            result = await self._execute(query.limit(fetch_limit), 'long')
             candidates = result.data if result.data else []
 
             selected = []
@@ -1698,7 +2008,6 @@ class DatabaseService:
                     raw_updated = auction.get('updated_at')
                     if raw_updated:
                         try:
-                            from utils.date_utils import parse_iso_datetime
                             last_update = parse_iso_datetime(raw_updated)
                             if last_update and last_update.tzinfo is None:
                                 last_update = last_update.replace(tzinfo=timezone.utc)
@@ -1768,7 +2077,7 @@ class DatabaseService:
                 
             # First fetch existing statistics to merge
             # Using ilike for case-insensitivity to find the domain
-            response = self.client.table('auctions').select('domain', 'page_statistics').ilike('domain', domain).execute()
+            response = await self._execute(self.client.table('auctions').select('domain', 'page_statistics').ilike('domain', domain), 'medium')
             
             if not response.data or len(response.data) == 0:
                 # logger.warning("Domain not found for statistics update", domain=domain)
@@ -1865,7 +2174,7 @@ class DatabaseService:
                 return True
 
             try:
-                update_response = self.client.table('auctions').update(update_data).eq('domain', actual_domain).execute()
+                update_response = await self._execute(self.client.table('auctions').update(update_data).eq('domain', actual_domain), 'medium')
             except Exception as e:
                 # Handle missing column gracefully (especially keywords_count which might be new)
                 error_str = str(e)
@@ -1875,7 +2184,7 @@ class DatabaseService:
                     update_data.pop('keywords_count', None)
                     if not update_data:
                         return True
-                    update_response = self.client.table('auctions').update(update_data).eq('domain', domain).execute()
+                    update_response = await self._execute(self.client.table('auctions').update(update_data).eq('domain', domain), 'medium')
                 else:
                     logger.error("Error updating auction record", domain=domain, error=error_str)
                     return False
@@ -1907,10 +2216,9 @@ class DatabaseService:
             # Note: With 1.6M+ rows, fetching all domains is a performance disaster (OOM risk)
             # We'll limit to a large enough sample of recent auctions to get the current TLDs
             result = (
-                self.client.table('auctions')
+                await self._execute(self.client.table('auctions')
                 .select('domain')
-                .limit(10000)  # Moderate sample for performance
-                .execute()
+                .limit(10000), 'long')
             )
             
             tlds = set()
@@ -2248,7 +2556,7 @@ class DatabaseService:
                 job_data['offering_type'] = offering_type
             
             try:
-                result = self.client.table('csv_upload_progress').insert(job_data).execute()
+                result = await self._execute(self.client.table('csv_upload_progress').insert(job_data), 'medium')
                 
                 if result.data and len(result.data) > 0:
                     logger.info("Created CSV upload job", job_id=job_id, filename=filename)
@@ -2263,7 +2571,7 @@ class DatabaseService:
                     # Try to create the table
                     await self._ensure_csv_progress_table_exists()
                     # Retry the insert
-                    result = self.client.table('csv_upload_progress').insert(job_data).execute()
+                    result = await self._execute(self.client.table('csv_upload_progress').insert(job_data), 'medium')
                     if result.data and len(result.data) > 0:
                         logger.info("Created CSV upload job after table creation", job_id=job_id, filename=filename)
                         return result.data[0]
@@ -2421,10 +2729,9 @@ class DatabaseService:
                 return await self.get_csv_upload_progress(job_id)
             
             result = (
-                self.client.table('csv_upload_progress')
+                await self._execute(self.client.table('csv_upload_progress')
                 .update(update_data)
-                .eq('job_id', job_id)
-                .execute()
+                .eq('job_id', job_id), 'medium')
             )
             
             if result.data and len(result.data) > 0:
@@ -2458,10 +2765,9 @@ class DatabaseService:
             
             # Use execute() instead of single() to avoid PGRST116 error if not found
             result = (
-                self.client.table('csv_upload_progress')
+                await self._execute(self.client.table('csv_upload_progress')
                 .select('*')
-                .eq('job_id', job_id)
-                .execute()
+                .eq('job_id', job_id), 'short')
             )
             
             if result.data and len(result.data) > 0:
@@ -2489,13 +2795,12 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             result = (
-                self.client.table('csv_upload_progress')
+                await self._execute(self.client.table('csv_upload_progress')
                 .select('*')
                 .not_.eq('status', 'completed')
                 .not_.eq('status', 'failed')
                 .order('created_at', desc=True)
-                .limit(1)
-                .execute()
+                .limit(1), 'short')
             )
             
             if result.data and len(result.data) > 0:
@@ -2517,11 +2822,10 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
 
             # 1. Get the default provider
-            provider_result = self.client.table('llm_providers')\
+            provider_result = await self._execute(self.client.table('llm_providers')\
                 .select('*')\
                 .eq('is_default', True)\
-                .limit(1)\
-                .execute()
+                .limit(1), 'short')
 
             if not provider_result.data:
                 logger.warning("No default LLM provider found in llm_providers table")
@@ -2535,11 +2839,10 @@ class DatabaseService:
                 return None
 
             # 2. Get the API key
-            key_result = self.client.table('api_keys')\
+            key_result = await self._execute(self.client.table('api_keys')\
                 .select('*')\
                 .eq('id', api_keys_id)\
-                .limit(1)\
-                .execute()
+                .limit(1), 'short')
                 
             if not key_result.data:
                 logger.error("API key record not found for default provider", api_keys_id=api_keys_id)
@@ -2567,12 +2870,11 @@ class DatabaseService:
                 raise Exception("Supabase client not available")
             
             # Query for active DataForSEO key
-            result = self.client.table('api_keys')\
+            result = await self._execute(self.client.table('api_keys')\
                 .select('*')\
                 .eq('provider', 'dataforseo')\
                 .eq('is_active', True)\
-                .limit(1)\
-                .execute()
+                .limit(1), 'short')
                 
             if not result.data:
                 logger.warning("No active DataForSEO key found in api_keys table")
@@ -2590,22 +2892,16 @@ class DatabaseService:
             return None
 
 
-# Global database service instance
-_db_service: Optional[DatabaseService] = None
+@functools.lru_cache(maxsize=None)
+def get_database() -> DatabaseService:
+    """Get database service instance, creating it on first use"""
+    return DatabaseService()
 
 
 async def init_database():
-    """Initialize database service"""
-    global _db_service
-    if _db_service is None:
-        _db_service = DatabaseService()
-        await _db_service.init_database()
-    return _db_service
-
-
-def get_database() -> DatabaseService:
-    """Get database service instance"""
-    global _db_service
-    if _db_service is None:
-        raise RuntimeError("Database service not initialized")
-    return _db_service
+    """Initialize database service once per process"""
+    db = get_database()
+    if not db.initialized:
+        db.initialized = True
+        await db.init_database()
+    return db
@@ -22,6 +22,11 @@ from utils.date_utils import parse_iso_datetime
 
 logger = structlog.get_logger()
 
+# Stage 1 patterns, compiled once rather than looked up per scored domain
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_DIGIT_RE = re.compile(r'\d')
+_CAMEL_TOKEN_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)')
+
 
 class DomainScoringService:
     """Service for scoring and filtering domains"""
@@ -116,11 +121,11 @@ class DomainScoringService:
             return False, f"Domain name exceeds {self.max_length} characters"
         
         # Filter 3.3: Punctuation
-        if '-' in name_part or re.search(r'[^a-zA-Z0-9]', name_part):
+        if '-' in name_part or _NON_ALNUM_RE.search(name_part):
             return False, "Contains hyphens or special characters"
         
         # Filter 3.4: Numerics
-        number_count = len(re.findall(r'\d', name_part))
+        number_count = len(_DIGIT_RE.findall(name_part))
         if number_count > self.max_numbers:
             return False, f"Contains more than {self.max_numbers} numbers"
         
@@ -152,7 +157,7 @@ class DomainScoringService:
         
         # Fallback: heuristic splitting (camelCase, etc.)
         # Split on capital letters
-        tokens = re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)', domain_name)
+        tokens = _CAMEL_TOKEN_RE.findall(domain_name)
         if tokens:
             return tokens
         
@@ -4,6 +4,7 @@ External API services for domain analysis
 
 import httpx
 import asyncio
+import hashlib
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 import structlog
@@ -867,15 +868,20 @@ class WaybackMachineService:
             logger.warning("Wayback Machine health check failed", error=str(e))
             return False
     
-    async def get_domain_history(self, domain: str) -> Optional[Dict[str, Any]]:
+    async def get_domain_history(self, domain: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """Get domain history from Wayback Machine"""
         try:
-            # Check cache first
             db = get_database()
-            cached_data = await db.get_raw_data(domain, DataSource.WAYBACK_MACHINE)
-            if cached_data:
-                logger.info("Using cached Wayback Machine data", domain=domain)
-                return cached_data
+            if use_cache:
+                # Check cache first; recently expired history is served while it is refreshed
+                cached_data = await db.get_raw_data(
+                    domain,
+                    DataSource.WAYBACK_MACHINE,
+                    revalidate=lambda: self.get_domain_history(domain, use_cache=False)
+                )
+                if cached_data:
+                    logger.info("Using cached Wayback Machine data", domain=domain)
+                    return cached_data
             
             # Format domain for Wayback Machine API (remove protocol for domain match)
             wayback_url = domain.replace("https://", "").replace("http://", "").replace("www.", "")
@@ -1054,6 +1060,11 @@ class LLMService:
             # Prepare the analysis prompt
             prompt = self._build_analysis_prompt(domain, data)
             
+            prompt_hash = self._prompt_hash(provider, model_name, prompt)
+            cached = await self._get_cached_analysis(domain, prompt_hash)
+            if cached:
+                return cached
+            
             if provider == "gemini":
                 result = await self._generate_with_gemini(prompt, domain, model_name)
             elif provider == "openai":
@@ -1063,6 +1074,7 @@ class LLMService:
                 return None
                 
             if result:
+                 await self._cache_analysis(domain, prompt_hash, result)
                  await self.usage_tracking.track_usage(
                     user_id=user_id,
                     resource_type='llm',
@@ -1090,6 +1102,11 @@ class LLMService:
         prompt = self._build_enhanced_analysis_prompt(domain, data)
         logger.info("Enhanced prompt generated", domain=domain, prompt_length=len(prompt), prompt_preview=prompt[:500])
         
+        prompt_hash = self._prompt_hash(provider, model_name, prompt)
+        cached = await self._get_cached_analysis(domain, prompt_hash)
+        if cached:
+            return cached
+        
         if provider == "gemini":
             result = await self._generate_with_gemini(prompt, domain, model_name)
         elif provider == "openai":
@@ -1100,6 +1117,8 @@ class LLMService:
         
         if not result:
             raise ValueError("LLM service returned no data")
+        
+        await self._cache_analysis(domain, prompt_hash, result)
             
         await self.usage_tracking.track_usage(
             user_id=user_id,
@@ -1112,6 +1131,39 @@ class LLMService:
         
         return result
     
+    @staticmethod
+    def _prompt_hash(provider: str, model_name: Optional[str], prompt: str) -> str:
+        return hashlib.sha256(f"{provider}:{model_name}:{prompt}".encode('utf-8')).hexdigest()
+    
+    async def _get_cached_analysis(self, domain: str, prompt_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the analysis previously generated for exactly this prompt, if cached.
+        
+        Re-running an analysis on unchanged data builds the same prompt, so the
+        stored result is reused instead of paying for another LLM call.
+        """
+        try:
+            cached = await get_database().get_raw_data(domain, DataSource.LLM)
+        except Exception as e:
+            logger.warning("LLM cache lookup failed", domain=domain, error=str(e))
+            return None
+        if cached and cached.get('prompt_hash') == prompt_hash and cached.get('analysis'):
+            logger.info("Using cached LLM analysis", domain=domain)
+            return cached['analysis']
+        return None
+    
+    async def _cache_analysis(self, domain: str, prompt_hash: str, result: Dict[str, Any]):
+        try:
+            await get_database().save_raw_data(
+                domain,
+                DataSource.LLM,
+                {'prompt_hash': prompt_hash, 'analysis': result},
+                ttl_seconds=self.settings.LLM_ANALYSIS_CACHE_TTL_SECONDS,
+                merge=False
+            )
+        except Exception as e:
+            logger.warning("Failed to cache LLM analysis", domain=domain, error=str(e))
+    
     async def _generate_with_gemini(self, prompt: str, domain: str, model_name: str = 'gemini-2.0-flash-exp') -> Optional[Dict[str, Any]]:
         """Generate analysis using Gemini"""
         import google.generativeai as genai
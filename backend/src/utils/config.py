@@ -36,6 +36,15 @@ class Settings(BaseSettings):
     # Cache settings
     REDIS_URL: str = "redis://localhost:6379"
     CACHE_TTL_SECONDS: int = 2592000  # 30 days
+    DB_READ_CACHE_TTL_SECONDS: int = 30  # In-process cache for get_report/get_raw_data (0 disables)
+    DB_READ_CACHE_MAX_ENTRIES: int = 10000
+    RAW_DATA_STALE_WINDOW_SECONDS: int = 86400  # Serve expired raw data this long while it is refreshed
+    LLM_ANALYSIS_CACHE_TTL_SECONDS: int = 604800  # 7 days; reuse analyses generated from an identical prompt
+    # Upper bounds on a single PostgREST call, by operation class
+    DB_READ_TIMEOUT_SECONDS: float = 10.0
+    DB_WRITE_TIMEOUT_SECONDS: float = 30.0
+    DB_BULK_TIMEOUT_SECONDS: float = 120.0
+    DB_MAX_CONCURRENT_REQUESTS: int = 25  # Keep below the Supabase httpx pool's 30 connections
     
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -3,18 +3,23 @@ Robust date parsing utilities
 """
 
 import datetime
+import sys
 from typing import Optional, Union
 from dateutil import parser
 import structlog
 
 logger = structlog.get_logger()
 
+# From 3.11 fromisoformat accepts 'Z' and any number of fractional digits,
+# which covers every timestamp PostgREST returns, and it is much cheaper than dateutil
+_FROMISOFORMAT_IS_COMPLETE = sys.version_info >= (3, 11)
+
 def parse_iso_datetime(dt_str: Union[str, datetime.datetime]) -> Optional[datetime.datetime]:
     """
     Robustly parse ISO datetime strings, handling variable fractional seconds
     and timezone offsets that Python 3.10's fromisoformat might struggle with.
     """
-    if dt_str is None:
+    if dt_str is None or dt_str == '':
         return None
         
     if isinstance(dt_str, datetime.datetime):
@@ -24,6 +29,12 @@ def parse_iso_datetime(dt_str: Union[str, datetime.datetime]) -> Optional[dateti
         logger.warning("Attempted to parse non-string datetime", type=type(dt_str), value=dt_str)
         return None
 
+    if _FROMISOFORMAT_IS_COMPLETE:
+        try:
+            return datetime.datetime.fromisoformat(dt_str)
+        except ValueError:
+            pass
+
     try:
         # Standardize 'Z' to '+00:00'
         dt_str = dt_str.replace('Z', '+00:00')
@@ -0,0 +1,33 @@
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from services.bulk_analysis_service import BulkAnalysisService
+
+
+class TestTriggerBulkDataCollection(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_through_all_missing_domains(self):
+        db = MagicMock(get_bulk_domains_missing_summary=AsyncMock(side_effect=[['a.com', 'b.com'], ['c.com'], []]))
+        with patch('services.bulk_analysis_service.get_database', return_value=db), \
+                patch('services.bulk_analysis_service.N8NService'):
+            service = BulkAnalysisService()
+        service._MISSING_SUMMARY_PAGE_SIZE = 2
+        service.n8n_service.trigger_bulk_page_summary_workflow = AsyncMock(return_value={'request_id': 'r1'})
+
+        result = await service.trigger_bulk_data_collection()
+
+        self.assertEqual(result['domains'], ['a.com', 'b.com', 'c.com'])
+        self.assertEqual(
+            [call.kwargs['after'] for call in db.get_bulk_domains_missing_summary.await_args_list],
+            [None, 'b.com', 'c.com']
+        )
+        service.n8n_service.trigger_bulk_page_summary_workflow.assert_awaited_once_with(['a.com', 'b.com', 'c.com'])
+
+
+if __name__ == '__main__':
+    unittest.main()
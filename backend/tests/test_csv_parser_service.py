@@ -0,0 +1,175 @@
+
+import io
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+import pandas as pd
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from services.csv_parser_service import CSVParserService, PYARROW_AVAILABLE, _read_csv_chunks
+
+
+class TestParsePrice(unittest.TestCase):
+    def setUp(self):
+        self.parser = CSVParserService()
+
+    def test_bare_numeric_strings(self):
+        self.assertEqual(self.parser._parse_price('150'), 150.0)
+        self.assertEqual(self.parser._parse_price(' 25.50 '), 25.5)
+
+    def test_already_numeric_values(self):
+        self.assertEqual(self.parser._parse_price(5), 5.0)
+        self.assertEqual(self.parser._parse_price(7.25), 7.25)
+
+    def test_formatted_strings(self):
+        self.assertEqual(self.parser._parse_price('$1,234.50'), 1234.5)
+        self.assertEqual(self.parser._parse_price('-3'), -3.0)
+
+    def test_non_numeric_strings(self):
+        self.assertIsNone(self.parser._parse_price(''))
+        self.assertIsNone(self.parser._parse_price('   '))
+        self.assertIsNone(self.parser._parse_price('abc'))
+        self.assertIsNone(self.parser._parse_price('nan'))
+        self.assertIsNone(self.parser._parse_price('inf'))
+
+
+class TestParseGoDaddyCsv(unittest.TestCase):
+    def test_fallback_columns_and_skipped_rows(self):
+        content = (
+            "Domain,End Date,endDate,Price,price\n"
+            "a.com,,2024-03-01,,7\n"
+            ",2024-03-01,,1,\n"
+            "b.com,,,2,\n"
+            " c.com ,2024-04-01T00:00:00Z,,\"$1,000\",\n"
+        )
+        auctions = list(CSVParserService().parse_csv(content, 'godaddy'))
+        self.assertEqual([a.domain for a in auctions], ['a.com', 'c.com'])
+        self.assertEqual(auctions[0].current_bid, 7.0)
+        self.assertEqual(auctions[0].expiration_date.year, 2024)
+        self.assertEqual(auctions[1].current_bid, 1000.0)
+        self.assertEqual(auctions[1].source_data['Domain'], ' c.com ')
+
+
+class TestParseNameSiloCsv(unittest.TestCase):
+    def test_auction_export(self):
+        content = (
+            "Domain,Type,Current Bid,Domain Created On,Auction End,Url\n"
+            "a.com,Auction,25.5,2015-01-01,2024-06-01 12:00:00,https://x\n"
+            ",Auction,1,,,\n"
+            "b.com,Offer/Counter Offer,,,,\n"
+        )
+        auctions = list(CSVParserService().parse_csv(content, 'namesilo'))
+        self.assertEqual([a.domain for a in auctions], ['a.com', 'b.com'])
+        self.assertEqual(auctions[0].current_bid, 25.5)
+        self.assertEqual(auctions[0].link, 'https://x')
+        self.assertEqual(auctions[1].current_bid, 0.0)
+        self.assertEqual(auctions[1].expiration_date.year, 2099)
+        self.assertEqual(auctions[1].link, 'https://www.namesilo.com/marketplace/domain-details/b.com')
+
+    def test_active_sales(self):
+        content = "Domain,Buy_Now,Sale_Type,End_Date\na.com,150 (hidden),Buy Now,\n"
+        auctions = list(CSVParserService().parse_csv(content, 'namesilo'))
+        self.assertEqual(len(auctions), 1)
+        self.assertEqual(auctions[0].current_bid, 150.0)
+        self.assertEqual(auctions[0].source_data['Buy_Now'], '150 (hidden)')
+
+
+class TestParseGenericCsv(unittest.TestCase):
+    def test_missing_required_columns(self):
+        with self.assertRaises(ValueError):
+            list(CSVParserService().parse_csv("foo,bar\n1,2\n", 'dynadot'))
+
+
+class TestParseCsvBytes(unittest.TestCase):
+    def test_bytes_source_matches_str_source(self):
+        content = "\ufeffname,startDate,endDate,price\nbytes.com,2023-01-01,2023-12-31,$5\n"
+        parser = CSVParserService()
+        for site in ('namecheap', 'godaddy', 'dynadot'):
+            from_str = [a.model_dump() for a in parser.parse_csv(content.lstrip('\ufeff'), site)]
+            from_bytes = [a.model_dump() for a in parser.parse_csv(content.encode('utf-8'), site)]
+            self.assertEqual(from_bytes, from_str, site)
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+class TestPyarrowReader(unittest.TestCase):
+    def _read(self, data):
+        with io.TextIOWrapper(io.BytesIO(data), encoding='utf-8-sig', errors='replace', newline='') as csv_file:
+            chunks = _read_csv_chunks(csv_file)
+            return pd.concat(list(chunks))
+
+    def _assert_matches_pandas(self, data):
+        # Small blocks so the bad row lands well after the first one
+        with patch('services.csv_parser_service._PYARROW_BLOCK_BYTES', 1 << 16):
+            from_arrow = self._read(data)
+        with patch('services.csv_parser_service.PYARROW_AVAILABLE', False):
+            from_pandas = self._read(data)
+        pd.testing.assert_frame_equal(from_arrow, from_pandas)
+
+    def _rows(self, count):
+        return "".join(f"d{i}.com,2024-01-01,{i}\n" for i in range(count))
+
+    def test_short_row_mid_file_is_padded(self):
+        content = "name,endDate,price\n" + self._rows(40000) + "short.com\n" + self._rows(10)
+        self._assert_matches_pandas(content.encode('utf-8'))
+
+    def test_invalid_utf8_mid_file_is_replaced(self):
+        data = ("name,endDate,price\n" + self._rows(40000)).encode('utf-8') + b"bad\xff.com,2024-01-01,1\n"
+        self._assert_matches_pandas(data)
+
+    def test_header_with_bom_blank_lines_and_quoted_newline(self):
+        content = "\ufeff\n\r\nname,\"end\nDate\",price\r\n" + self._rows(40000)
+        with patch('services.csv_parser_service.logger') as logger:
+            self._assert_matches_pandas(content.encode('utf-8'))
+        logger.warning.assert_not_called()
+
+    def test_memory_map_is_closed(self):
+        opened = []
+        memory_map = pa.memory_map
+
+        def track(path):
+            opened.append(memory_map(path))
+            return opened[-1]
+
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='') as f:
+            f.write("name,endDate,price\n" + self._rows(40000))
+            f.flush()
+            with open(f.name, newline='') as csv_file, \
+                    patch('services.csv_parser_service.pa.memory_map', side_effect=track):
+                rows = sum(len(df) for df in _read_csv_chunks(csv_file))
+
+        self.assertEqual(rows, 40000)
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+
+class TestParseCsvIter(unittest.TestCase):
+    def test_batches(self):
+        content = "domain,expiration_date\n" + "".join(f"d{i}.com,2024-01-01\n" for i in range(5))
+        batches = list(CSVParserService().parse_csv_iter(content, 'dynadot', batch_size=2))
+        self.assertEqual([len(b) for b in batches], [2, 2, 1])
+        self.assertEqual(batches[2][0].domain, 'd4.com')
+
+
+class TestParseGoDaddyJson(unittest.TestCase):
+    def test_numeric_price(self):
+        content = '{"data": [{"domainName": "a.com", "auctionEndTime": "2024-01-01T00:00:00Z", "price": 5}]}'
+        auctions = list(CSVParserService().parse_godaddy_json(content))
+        self.assertEqual(len(auctions), 1)
+        self.assertEqual(auctions[0].current_bid, 5.0)
+
+    def test_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            CSVParserService().parse_godaddy_json('{"data": [')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+import sys
+import threading
+import os
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from services.database import DatabaseService
+from models.domain_analysis import BulkDomainInput, DataSource
+from utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=10, ttl=5)
+        with patch('utils.ttl_cache.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('utils.ttl_cache.time.monotonic', return_value=104.0):
+            self.assertEqual(cache.get('a'), 1)
+        with patch('utils.ttl_cache.time.monotonic', return_value=105.0):
+            self.assertIsNone(cache.get('a'))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+
+class TestDatabaseReadCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        settings = MagicMock(
+            DB_READ_CACHE_TTL_SECONDS=30, DB_READ_CACHE_MAX_ENTRIES=100, RAW_DATA_STALE_WINDOW_SECONDS=3600,
+            DB_READ_TIMEOUT_SECONDS=10, DB_WRITE_TIMEOUT_SECONDS=30, DB_BULK_TIMEOUT_SECONDS=120,
+            DB_MAX_CONCURRENT_REQUESTS=25, CACHE_TTL_SECONDS=3600
+        )
+        with patch('services.database.get_settings', return_value=settings), \
+                patch.object(DatabaseService, '_initialize_client'):
+            self.db = DatabaseService()
+        self.db.client = MagicMock()
+
+    async def test_get_raw_data_is_cached_and_copied(self):
+        result = MagicMock(data=[{'api_source': 'dataforseo', 'json_data': {'rank': 1}, 'expires_at': None}])
+        execute = self.db.client.table().select().eq().eq().execute
+        execute.return_value = result
+
+        first = await self.db.get_raw_data('a.com', DataSource.DATAFORSEO)
+        first['rank'] = 2
+        second = await self.db.get_raw_data('a.com', DataSource.DATAFORSEO)
+
+        self.assertEqual(second, {'rank': 1})
+        self.assertEqual(execute.call_count, 1)
+
+    async def test_concurrent_misses_query_once(self):
+        result = MagicMock(data=[{'api_source': 'dataforseo', 'json_data': {'rank': 1}, 'expires_at': None}])
+        execute = self.db.client.table().select().eq().eq().execute
+        execute.return_value = result
+
+        values = await asyncio.gather(*(self.db.get_raw_data('a.com', DataSource.DATAFORSEO) for _ in range(5)))
+
+        self.assertEqual(values, [{'rank': 1}] * 5)
+        self.assertEqual(execute.call_count, 1)
+
+    async def test_delete_invalidates(self):
+        result = MagicMock(data=[{'api_source': 'dataforseo', 'json_data': {'rank': 1}, 'expires_at': None}])
+        execute = self.db.client.table().select().eq().eq().execute
+        execute.return_value = result
+
+        await self.db.get_raw_data('a.com', DataSource.DATAFORSEO)
+        await self.db.delete_raw_data('a.com', DataSource.DATAFORSEO)
+        await self.db.get_raw_data('a.com', DataSource.DATAFORSEO)
+
+        self.assertEqual(execute.call_count, 2)
+
+    async def test_save_raw_data_without_merge_replaces_entry(self):
+        select = self.db.client.table().select().eq().eq().execute
+        upsert = self.db.client.table().upsert
+        upsert().select().execute.return_value = MagicMock(data=[{'id': '1'}])
+
+        before = datetime.now(timezone.utc)
+        await self.db.save_raw_data('a.com', DataSource.LLM, {'analysis': {}}, ttl_seconds=60, merge=False)
+
+        row = upsert.call_args[0][0]
+        self.assertEqual(row['json_data'], {'analysis': {}})
+        self.assertLess(datetime.fromisoformat(row['expires_at']), before + timedelta(seconds=120))
+        select.assert_not_called()
+
+    async def test_missing_mode_config_is_cached(self):
+        execute = self.db.client.table().select().eq().limit().execute
+        execute.return_value = MagicMock(data=[])
+
+        self.assertIsNone(await self.db.get_mode_config('a.com'))
+        self.assertIsNone(await self.db.get_mode_config('a.com'))
+
+        self.assertEqual(execute.call_count, 1)
+
+    async def test_bulk_domain_is_cached_until_summary_saved(self):
+        execute = self.db.client.table().select().eq().limit().execute
+        execute.return_value = MagicMock(data=[{'id': '1', 'domain_name': 'a.com', 'provider': 'Namecheap'}])
+
+        await self.db.get_bulk_domain('a.com')
+        await self.db.get_bulk_domain('a.com')
+        self.assertEqual(execute.call_count, 1)
+
+        self.db.client.table().update().eq().execute.return_value = MagicMock(data=[{'id': '1'}])
+        await self.db.save_bulk_page_summary('a.com', {})
+        record = await self.db.get_bulk_domain('a.com')
+
+        self.assertEqual(record.domain_name, 'a.com')
+        self.assertEqual(execute.call_count, 2)
+
+    async def test_sync_bulk_domains_maps_rpc_result(self):
+        self.db.client.rpc.return_value.execute.return_value = MagicMock(data={
+            'inserted': ['new.com', 'unknown.com'],
+            'updated': ['changed.com']
+        })
+        domains = [
+            BulkDomainInput(domain='new.com', provider='Namecheap'),
+            BulkDomainInput(domain='changed.com', provider='GoDaddy'),
+            BulkDomainInput(domain='same.com', provider='Namecheap'),
+            BulkDomainInput(domain='new.com', provider='Namecheap'),
+        ]
+
+        result = await self.db.sync_bulk_domains(domains)
+
+        sent = self.db.client.rpc.call_args[0][1]['p_domains']
+        self.assertEqual([d['domain_name'] for d in sent], ['new.com', 'changed.com', 'same.com'])
+        self.assertEqual(result.created_domains, ['new.com'])
+        self.assertEqual(result.updated_domains, ['changed.com'])
+        self.assertEqual(result.skipped_domains, ['same.com', 'new.com'])
+        self.assertEqual((result.created_count, result.updated_count, result.skipped_count), (1, 1, 2))
+        self.assertEqual(result.total_count, 4)
+
+    async def test_timed_out_query_keeps_its_slot_until_it_finishes(self):
+        self.db._request_slots = asyncio.Semaphore(1)
+        self.db._timeouts['short'] = 0.05
+        finish = threading.Event()
+        query = MagicMock()
+        query.execute.side_effect = lambda: finish.wait(5)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.db._execute(query, 'short')
+        self.assertTrue(self.db._request_slots.locked())
+
+        finish.set()
+        for _ in range(100):
+            if not self.db._request_slots.locked():
+                break
+            await asyncio.sleep(0.01)
+        self.assertFalse(self.db._request_slots.locked())
+
+    async def test_namecheap_insert_failures_are_not_counted_as_skipped(self):
+        self.db._NAMECHEAP_RETRY_DELAY_SECONDS = 0
+        upsert = self.db.client.table().upsert().select().execute
+        upsert.side_effect = [
+            Exception('502 Bad Gateway'),
+            MagicMock(data=[{'id': '1'}]),
+            Exception('connection reset'), Exception('connection reset'), Exception('connection reset'),
+        ]
+
+        inserted = await self.db._insert_namecheap_rows([{'name': 'a.com'}, {'name': 'b.com'}])
+        failed = await self.db._insert_namecheap_rows([{'name': 'c.com'}])
+
+        self.assertEqual(inserted, {'inserted': 1, 'failed': 0})
+        self.assertEqual(failed, {'inserted': 0, 'failed': 1})
+        self.assertEqual(upsert.call_count, 5)
+
+    async def test_stale_data_is_served_while_revalidating(self):
+        expired = (datetime.utcnow() - timedelta(minutes=5)).isoformat()
+        result = MagicMock(data=[{'api_source': 'wayback_machine', 'json_data': {'captures': 1}, 'expires_at': expired}])
+        self.db.client.table().select().eq().eq().execute.return_value = result
+        calls = []
+
+        async def revalidate():
+            calls.append(1)
+
+        first = await self.db.get_raw_data('a.com', DataSource.WAYBACK_MACHINE, revalidate=revalidate)
+        second = await self.db.get_raw_data('a.com', DataSource.WAYBACK_MACHINE, revalidate=revalidate)
+        await asyncio.sleep(0)
+
+        self.assertEqual(first, {'captures': 1})
+        self.assertEqual(second, {'captures': 1})
+        self.assertEqual(calls, [1])
+        self.assertIsNone(await self.db.get_raw_data('a.com', DataSource.WAYBACK_MACHINE))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+
+# Add backend/src to path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from services.external_apis import LLMService
+from models.domain_analysis import DataSource
+
+
+class TestLLMAnalysisCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        settings = MagicMock(LLM_ANALYSIS_CACHE_TTL_SECONDS=600)
+        with patch('services.external_apis.get_settings', return_value=settings), \
+                patch('services.external_apis.get_secrets_service'), \
+                patch('services.external_apis.UsageTrackingService'):
+            self.service = LLMService()
+        self.service.usage_tracking.track_usage = AsyncMock()
+        self.service._get_provider_and_key = AsyncMock(return_value=('openai', 'key', 'gpt-4o-mini'))
+        self.service._build_enhanced_analysis_prompt = MagicMock(return_value='prompt')
+        self.service._generate_with_openai = AsyncMock(return_value={'summary': 'fresh'})
+        self.prompt_hash = LLMService._prompt_hash('openai', 'gpt-4o-mini', 'prompt')
+
+        self.db = MagicMock(get_raw_data=AsyncMock(), save_raw_data=AsyncMock())
+        patcher = patch('services.external_apis.get_database', return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_hit_skips_generation_and_usage_tracking(self):
+        self.db.get_raw_data.return_value = {'prompt_hash': self.prompt_hash, 'analysis': {'summary': 'cached'}}
+
+        result = await self.service.generate_enhanced_analysis('a.com', {})
+
+        self.assertEqual(result, {'summary': 'cached'})
+        self.db.get_raw_data.assert_awaited_once_with('a.com', DataSource.LLM)
+        self.service._generate_with_openai.assert_not_awaited()
+        self.service.usage_tracking.track_usage.assert_not_awaited()
+        self.db.save_raw_data.assert_not_awaited()
+
+    async def test_miss_generates_caches_and_tracks_usage(self):
+        self.db.get_raw_data.return_value = {'prompt_hash': 'other', 'analysis': {'summary': 'stale'}}
+
+        result = await self.service.generate_enhanced_analysis('a.com', {})
+
+        self.assertEqual(result, {'summary': 'fresh'})
+        self.service._generate_with_openai.assert_awaited_once()
+        self.db.save_raw_data.assert_awaited_once_with(
+            'a.com',
+            DataSource.LLM,
+            {'prompt_hash': self.prompt_hash, 'analysis': {'summary': 'fresh'}},
+            ttl_seconds=600,
+            merge=False
+        )
+        self.service.usage_tracking.track_usage.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
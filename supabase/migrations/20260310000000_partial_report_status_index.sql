@@ -0,0 +1,16 @@
+-- Replace the full reports(status) index with a partial one
+-- Completed reports are the vast majority of rows but are never looked up by
+-- status alone; queue-style queries only filter on the active/failed states.
+
+DROP INDEX IF EXISTS idx_reports_status;
+
+CREATE INDEX IF NOT EXISTS idx_reports_status_active
+ON reports(status, created_at DESC)
+WHERE status IN ('pending', 'in_progress', 'failed');
+
+-- cleanup_expired_data range-scans expires_at; rows without an expiry never match
+DROP INDEX IF EXISTS idx_raw_data_cache_expires_at;
+
+CREATE INDEX IF NOT EXISTS idx_raw_data_cache_expiring
+ON raw_data_cache(expires_at)
+WHERE expires_at IS NOT NULL;
@@ -0,0 +1,50 @@
+-- Store reports/raw_data_cache domain names in lowercase
+-- The backend now lowercases domain names before every read and write, so
+-- lookups by domain always hit the existing domain_name indexes instead of
+-- missing rows saved with different casing.
+
+-- Keep only the most recently updated row per case-insensitive domain.
+-- Rows are ranked rather than compared pairwise so NULL timestamps still
+-- lose to dated rows (and ties fall back to id) instead of surviving and
+-- breaking the UNIQUE constraint in the UPDATE below.
+DELETE FROM reports
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY LOWER(domain_name)
+            ORDER BY updated_at DESC NULLS LAST, id DESC
+        ) AS rn
+        FROM reports
+    ) ranked
+    WHERE rn > 1
+);
+
+UPDATE reports
+SET domain_name = LOWER(domain_name)
+WHERE domain_name <> LOWER(domain_name);
+
+-- Keep only the latest-expiring cache row per case-insensitive domain and source
+DELETE FROM raw_data_cache
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY LOWER(domain_name), api_source
+            ORDER BY expires_at DESC NULLS LAST, id DESC
+        ) AS rn
+        FROM raw_data_cache
+    ) ranked
+    WHERE rn > 1
+);
+
+UPDATE raw_data_cache
+SET domain_name = LOWER(domain_name)
+WHERE domain_name <> LOWER(domain_name);
+
+-- Prevent mixed-case rows from coming back
+ALTER TABLE reports DROP CONSTRAINT IF EXISTS reports_domain_name_lowercase;
+ALTER TABLE reports
+ADD CONSTRAINT reports_domain_name_lowercase CHECK (domain_name = LOWER(domain_name));
+
+ALTER TABLE raw_data_cache DROP CONSTRAINT IF EXISTS raw_data_cache_domain_name_lowercase;
+ALTER TABLE raw_data_cache
+ADD CONSTRAINT raw_data_cache_domain_name_lowercase CHECK (domain_name = LOWER(domain_name));
@@ -0,0 +1,11 @@
+-- Covering index for report status polling
+-- get_report_status reads only these columns by domain_name, so it can be
+-- answered by an index-only scan without touching the JSONB-heavy heap row.
+-- It also replaces idx_reports_domain_name, which duplicated the index behind
+-- the UNIQUE(domain_name) constraint.
+
+DROP INDEX IF EXISTS idx_reports_domain_name;
+
+CREATE INDEX IF NOT EXISTS idx_reports_domain_cover
+ON reports(domain_name)
+INCLUDE (status, processing_time_seconds, analysis_timestamp, error_message);
@@ -0,0 +1,42 @@
+-- Sync a bulk domain list in one statement
+-- Inserts missing domains and updates the provider of existing ones when a
+-- different, non-null provider is given. backlinks_bulk_page_summary is never
+-- touched. Runs as a single INSERT ... ON CONFLICT, so the whole list is
+-- applied atomically in one round trip.
+-- Returns one JSONB object {"inserted": [...], "updated": [...]} listing the
+-- domains written; domains that needed no change are in neither list. A single
+-- scalar result is not truncated by PostgREST's db-max-rows, unlike a row set.
+-- Input must not repeat a domain_name.
+
+DROP FUNCTION IF EXISTS sync_bulk_domains(JSONB);
+
+CREATE OR REPLACE FUNCTION sync_bulk_domains(p_domains JSONB)
+RETURNS JSONB
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH written AS (
+        INSERT INTO bulk_domain_analysis AS b (domain_name, provider)
+        SELECT x.domain_name, x.provider
+        FROM jsonb_to_recordset(p_domains) AS x(domain_name TEXT, provider TEXT)
+        ON CONFLICT (domain_name) DO UPDATE
+            SET provider = EXCLUDED.provider,
+                updated_at = NOW()
+            WHERE EXCLUDED.provider IS NOT NULL
+              AND b.provider IS DISTINCT FROM EXCLUDED.provider
+        RETURNING b.domain_name::TEXT AS domain_name, (b.xmax = 0) AS was_inserted
+    )
+    SELECT jsonb_build_object(
+        'inserted', COALESCE(jsonb_agg(domain_name) FILTER (WHERE was_inserted), '[]'::jsonb),
+        'updated', COALESCE(jsonb_agg(domain_name) FILTER (WHERE NOT was_inserted), '[]'::jsonb)
+    )
+    FROM written;
+$$;
+
+COMMENT ON FUNCTION sync_bulk_domains(JSONB) IS 'Inserts new bulk domains and updates changed providers atomically, preserving summaries. Returns {"inserted": [...], "updated": [...]}.';
+
+-- SECURITY DEFINER writer: only the backend's service role may call it
+REVOKE ALL ON FUNCTION sync_bulk_domains(JSONB) FROM PUBLIC;
+REVOKE ALL ON FUNCTION sync_bulk_domains(JSONB) FROM anon, authenticated;
+GRANT EXECUTE ON FUNCTION sync_bulk_domains(JSONB) TO service_role;
@@ -0,0 +1,12 @@
+-- Partial index for pending async task polling
+-- get_pending_task filters on (domain_name, task_type, status = 'pending') and
+-- takes the oldest match. Only pending rows are indexed, so the index stays
+-- small while completed tasks accumulate.
+CREATE INDEX IF NOT EXISTS idx_async_tasks_pending
+ON async_tasks(domain_name, task_type, created_at)
+WHERE status = 'pending';
+
+-- These duplicate the indexes behind UNIQUE(task_id) and
+-- UNIQUE(domain_name, data_type) and only add write cost.
+DROP INDEX IF EXISTS idx_async_tasks_task_id;
+DROP INDEX IF EXISTS idx_detailed_data_domain_type;
@@ -0,0 +1,18 @@
+-- Create RPC function to truncate namecheap_domains efficiently
+-- Replaces deleting every row through the REST API before each CSV reload
+
+CREATE OR REPLACE FUNCTION truncate_namecheap_domains_table()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    TRUNCATE TABLE namecheap_domains;
+END;
+$$;
+
+-- SECURITY DEFINER truncate: only the backend's service role may call it
+REVOKE ALL ON FUNCTION truncate_namecheap_domains_table() FROM PUBLIC;
+REVOKE ALL ON FUNCTION truncate_namecheap_domains_table() FROM anon, authenticated;
+GRANT EXECUTE ON FUNCTION truncate_namecheap_domains_table() TO service_role;